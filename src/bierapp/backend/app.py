@@ -19,7 +19,7 @@ def create_app() -> Tuple[Flask, DbService, ProductService, WarehouseService, In
         ConnectionError: If database connection fails.
     """
     app = Flask(__name__, template_folder=os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "resources", "templates")))
-    app.config['TEMPLATES_AUTO_RELOAD'] = True
+    app.config['TEMPLATES_AUTO_RELOAD'] = os.environ.get("FLASK_DEBUG", "false").lower() in ("1", "true")
     database_repository = PostgresRepository()
     database_repository.connect()
     database_service = DbService(database_repository)
@@ -48,6 +48,19 @@ class DbService(DatabasePort):
         """
         return self.repo.find_by_id(collection, document_id)
 
+    def find_fields_by_id(self, collection: str, document_id: str, fields: List[str]) -> Optional[Dict]:
+        """Retrieve only the given fields of a record by its ID.
+
+        Args:
+            collection (str): The name of the database collection.
+            document_id (str): The unique identifier of the record.
+            fields (List[str]): The field names to return.
+
+        Returns:
+            Optional[Dict]: The requested fields if found, otherwise None.
+        """
+        return self.repo.find_fields_by_id(collection, document_id, fields)
+
     def find_all(self, collection: str) -> List[Dict]:
         """Retrieve all records from a collection.
 
@@ -59,6 +72,43 @@ class DbService(DatabasePort):
         """
         return self.repo.find_all(collection)
 
+    def find_many_by_ids(self, collection: str, document_ids: List[str]) -> List[Dict]:
+        """Retrieve all records from a collection whose ID is in the given list.
+
+        Args:
+            collection (str): The name of the database collection.
+            document_ids (List[str]): The unique identifiers of the records.
+
+        Returns:
+            List[Dict]: A list containing the found records.
+        """
+        return self.repo.find_many_by_ids(collection, document_ids)
+
+    def find_page(self, collection: str, limit: int, offset: int = 0) -> List[Dict]:
+        """Retrieve one page of records from a collection ordered by ID.
+
+        Args:
+            collection (str): The name of the database collection.
+            limit (int): The maximum number of records to return.
+            offset (int): The number of records to skip.
+
+        Returns:
+            List[Dict]: A list containing the records on the page.
+        """
+        return self.repo.find_page(collection, limit, offset)
+
+    def find_where(self, collection: str, criteria: Dict) -> List[Dict]:
+        """Retrieve all records from a collection matching the given field values.
+
+        Args:
+            collection (str): The name of the database collection.
+            criteria (Dict): Field names mapped to the values they must match.
+
+        Returns:
+            List[Dict]: A list containing the matching records.
+        """
+        return self.repo.find_where(collection, criteria)
+
     def update(self, collection: str, document_id: str, data: Dict) -> bool:
         """Update a record in a collection.
 
@@ -83,3 +133,30 @@ class DbService(DatabasePort):
             bool: True if the deletion was successful, False otherwise.
         """
         return self.repo.delete(collection, document_id)
+
+    def aggregate_inventory_stats(self) -> Dict[str, Dict[str, int]]:
+        """Sum stocked quantities per warehouse and per product.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Totals keyed by `warehouses` and `products`.
+        """
+        return self.repo.aggregate_inventory_stats()
+
+    def aggregate_statistics(self) -> Dict[str, int]:
+        """Count products and warehouses and sum all stocked units.
+
+        Returns:
+            Dict[str, int]: `total_products`, `total_warehouses` and `total_stock_units`.
+        """
+        return self.repo.aggregate_statistics()
+
+    def count(self, collection: str) -> int:
+        """Count the records of a collection without loading them.
+
+        Args:
+            collection (str): The name of the database collection.
+
+        Returns:
+            int: Number of records.
+        """
+        return self.repo.count(collection)
@@ -111,13 +111,18 @@ class ProductService(ProductServicePort):
         """
         return self._normalize_product(self.db.find_by_id(self.COLLECTION, produkt_id))
 
-    def list_products(self) -> List[Dict]:
-        """Retrieve all products.
+    def list_products(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Retrieve all products, or one page of them ordered by ID.
+
+        Args:
+            limit (Optional[int]): Maximum number of products; None returns all.
+            offset (int): Number of products to skip when paging.
 
         Returns:
-            List[Dict]: A list containing all products.
+            List[Dict]: A list containing the products.
         """
-        return [product for product in (self._normalize_product(product) for product in self.db.find_all(self.COLLECTION)) if product is not None]
+        rows = self.db.find_all(self.COLLECTION) if limit is None else self.db.find_page(self.COLLECTION, limit, offset)
+        return [product for product in (self._normalize_product(product) for product in rows) if product is not None]
 
     def update_product(self, produkt_id: str, data: Dict) -> Dict:
         """Update an existing product.
@@ -182,13 +187,9 @@ class InventoryService(InventoryServicePort):
         Returns:
             Optional[Dict]: The inventory item if found, otherwise None.
         """
-        lager_id = self._normalize_id(lager_id)
-        produkt_id = self._normalize_id(produkt_id)
-        inventory = self.db.find_all(self.COLLECTION)
-        for item in inventory:
-            if int(item["lager_id"]) == lager_id and int(item["produkt_id"]) == produkt_id:
-                return item
-        return None
+        criteria = {"lager_id": self._normalize_id(lager_id), "produkt_id": self._normalize_id(produkt_id)}
+        matches = self.db.find_where(self.COLLECTION, criteria)
+        return matches[0] if matches else None
 
     def add_product(self, lager_id, produkt_id, menge: int) -> None:
         """Add a product to a warehouse inventory.
@@ -249,9 +250,7 @@ class InventoryService(InventoryServicePort):
         Returns:
             List[Dict]: A list of inventory entries.
         """
-        lager_id = self._normalize_id(lager_id)
-        inventory = self.db.find_all(self.COLLECTION)
-        return [item for item in inventory if int(item["lager_id"]) == lager_id]
+        return self.db.find_where(self.COLLECTION, {"lager_id": self._normalize_id(lager_id)})
 
     def set_quantity(self, lager_id, produkt_id, menge: int) -> None:
         """Set the quantity of a product in a warehouse.
@@ -281,8 +280,4 @@ class InventoryService(InventoryServicePort):
         Returns:
             Dict: Aggregated statistics across the system.
         """
-        products = self.db.find_all("products")
-        warehouses = self.db.find_all("warehouses")
-        inventory = self.db.find_all("inventory")
-        total_stock = sum(item["menge"] for item in inventory)
-        return {"total_products": len(products), "total_warehouses": len(warehouses), "total_stock_units": total_stock}
+        return self.db.aggregate_statistics()
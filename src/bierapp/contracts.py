@@ -45,6 +45,20 @@ class DatabasePort(ABC):
         """
         ...
 
+    @abstractmethod
+    def find_fields_by_id(self, collection: str, document_id: str, fields: List[str]) -> Optional[Dict]:
+        """Retrieve only the given fields of a single document by ID.
+
+        Args:
+            collection (str): Collection name.
+            document_id (str): Unique identifier of the document.
+            fields (List[str]): Field names to return.
+
+        Returns:
+            Optional[Dict]: The requested fields, or None if not found.
+        """
+        ...
+
     @abstractmethod
     def find_all(self, collection: str) -> List[Dict]:
         """Retrieve all documents from a collection.
@@ -57,6 +71,46 @@ class DatabasePort(ABC):
         """
         ...
 
+    @abstractmethod
+    def find_many_by_ids(self, collection: str, document_ids: List[str]) -> List[Dict]:
+        """Retrieve all documents whose ID is in the given list.
+
+        Args:
+            collection (str): Collection name.
+            document_ids (List[str]): Unique identifiers of the documents.
+
+        Returns:
+            List[Dict]: List of found documents.
+        """
+        ...
+
+    @abstractmethod
+    def find_page(self, collection: str, limit: int, offset: int = 0) -> List[Dict]:
+        """Retrieve one page of documents ordered by ID.
+
+        Args:
+            collection (str): Collection name.
+            limit (int): Maximum number of documents to return.
+            offset (int): Number of documents to skip.
+
+        Returns:
+            List[Dict]: List of documents on the page.
+        """
+        ...
+
+    @abstractmethod
+    def find_where(self, collection: str, criteria: Dict) -> List[Dict]:
+        """Retrieve all documents whose fields equal the given values.
+
+        Args:
+            collection (str): Collection name.
+            criteria (Dict): Field names mapped to the values they must match.
+
+        Returns:
+            List[Dict]: List of matching documents.
+        """
+        ...
+
     @abstractmethod
     def update(self, collection: str, document_id: str, data: Dict) -> bool:
         """Update a document in a collection.
@@ -84,6 +138,36 @@ class DatabasePort(ABC):
         """
         ...
 
+    @abstractmethod
+    def aggregate_inventory_stats(self) -> Dict[str, Dict[str, int]]:
+        """Sum stocked quantities per warehouse and per product.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Totals keyed by `warehouses` and `products`, each mapping an ID to its quantity.
+        """
+        ...
+
+    @abstractmethod
+    def aggregate_statistics(self) -> Dict[str, int]:
+        """Count products and warehouses and sum all stocked units.
+
+        Returns:
+            Dict[str, int]: `total_products`, `total_warehouses` and `total_stock_units`.
+        """
+        ...
+
+    @abstractmethod
+    def count(self, collection: str) -> int:
+        """Count the documents of a collection without loading them.
+
+        Args:
+            collection (str): Collection name.
+
+        Returns:
+            int: Number of documents.
+        """
+        ...
+
 # ============================================================
 # Product Service Port
 # ============================================================
@@ -125,11 +209,15 @@ class ProductServicePort(ABC):
         ...
 
     @abstractmethod
-    def list_products(self) -> List[Dict]:
-        """Return all known products.
+    def list_products(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Return all known products, or one page of them.
+
+        Args:
+            limit (Optional[int]): Maximum number of products; None returns all.
+            offset (int): Number of products to skip when paging.
 
         Returns:
-            List[Dict]: List of all product representations.
+            List[Dict]: List of product representations.
         """
         ...
 
@@ -67,16 +67,18 @@ function initIndexPage() {
     if (!body || !search || !status) return;
 
     let products = [];
+    let searchTexts = [];
+
+    function setProducts(items) {
+        products = items;
+        searchTexts = products.map((product) =>
+            [product.name, product.beschreibung, product.lieferant, product.id].map((value) => String(value || "").toLowerCase()).join("\n")
+        );
+    }
 
     function renderRows() {
         const query = (search.value || "").trim().toLowerCase();
-        const filtered = products.filter((product) => {
-            const name = String(product.name || "").toLowerCase();
-            const description = String(product.beschreibung || "").toLowerCase();
-            const supplier = String(product.lieferant || "").toLowerCase();
-            const id = String(product.id || "").toLowerCase();
-            return name.includes(query) || description.includes(query) || supplier.includes(query) || id.includes(query);
-        });
+        const filtered = products.filter((_, index) => searchTexts[index].includes(query));
 
         body.innerHTML = "";
         if (filtered.length === 0) {
@@ -86,11 +88,13 @@ function initIndexPage() {
             return;
         }
 
+        const pageSearch = window.location.search;
+        const fragment = document.createDocumentFragment();
         filtered.forEach((product) => {
             const currency = product.waehrung || "EUR";
             const price = Number(product.preis ?? 0);
             const formattedPrice = Number.isFinite(price) ? `${price.toFixed(2)} ${currency}` : `0.00 ${currency}`;
-            const params = new URLSearchParams(window.location.search);
+            const params = new URLSearchParams(pageSearch);
             params.set("edit_product_id", String(product.id));
             const editHref = `/page1?${params.toString()}`;
             const row = document.createElement("tr");
@@ -109,14 +113,15 @@ function initIndexPage() {
                     </div>
                 </td>
             `;
-            body.appendChild(row);
+            fragment.appendChild(row);
         });
+        body.appendChild(fragment);
     }
 
     async function loadProducts() {
         status.textContent = "Lade Produkte ...";
         try {
-            products = await api("/products");
+            setProducts(await api("/products"));
             renderRows();
             status.textContent = `${products.length} Produkt(e) geladen.`;
         } catch (error) {
@@ -135,7 +140,7 @@ function initIndexPage() {
 
         try {
             await api(`/products/${id}`, { method: "DELETE" });
-            products = products.filter((product) => String(product.id) !== String(id));
+            setProducts(products.filter((product) => String(product.id) !== String(id)));
             renderRows();
             status.textContent = `Produkt ${id} gelöscht.`;
         } catch (error) {
@@ -488,6 +493,16 @@ function initProductPage() {
         renderProductOptions();
     }
 
+    function storeProduct(product) {
+        const index = products.findIndex((item) => String(item.id) === String(product.id));
+        if (index === -1) {
+            products.push(product);
+        } else {
+            products[index] = product;
+        }
+        renderProductOptions();
+    }
+
     async function loadWarehouses() {
         warehouses = await api("/warehouses");
         renderWarehouseStocks();
@@ -523,18 +538,18 @@ function initProductPage() {
                 method: "POST",
                 body: JSON.stringify(payload),
             });
-            await loadProducts();
+            storeProduct(created);
             productSelect.value = String(created.id);
             fillProductForm(created.id);
             setStatus(`Produkt ${created.id} erstellt.`);
             return String(created.id);
         }
 
-        await api(`/products/${existingId}`, {
+        const updated = await api(`/products/${existingId}`, {
             method: "PUT",
             body: JSON.stringify(payload),
         });
-        await loadProducts();
+        storeProduct(updated);
         productSelect.value = String(existingId);
         fillProductForm(existingId);
         setStatus(`Produkt ${existingId} aktualisiert.`);
@@ -575,7 +590,8 @@ function initProductPage() {
         if (!productId) throw new Error("Bitte zuerst ein Produkt auswählen.");
         if (!confirm(`Produkt ${productId} löschen?`)) return;
         await api(`/products/${productId}`, { method: "DELETE" });
-        await loadProducts();
+        products = products.filter((product) => String(product.id) !== String(productId));
+        renderProductOptions();
         productSelect.value = "";
         clearForm();
         setStatus(`Produkt ${productId} gelöscht.`);
@@ -1059,7 +1075,7 @@ function initStatsPage() {
 
     (async function run() {
         try {
-            const [warehouses, products] = await Promise.all([api("/warehouses"), api("/products")]);
+            const [warehouses, products, inventory] = await Promise.all([api("/warehouses"), api("/products"), api("/inventory")]);
             const productMap = new Map(products.map((product) => [String(product.id), product.name || `Produkt ${product.id}`]));
             const productMeta = new Map(
                 products.map((product) => [
@@ -1088,8 +1104,15 @@ function initStatsPage() {
                 });
             });
 
+            const itemsByWarehouse = new Map();
+            inventory.forEach((item) => {
+                const key = String(item.lager_id);
+                if (!itemsByWarehouse.has(key)) itemsByWarehouse.set(key, []);
+                itemsByWarehouse.get(key).push(item);
+            });
+
             for (const warehouse of warehouses) {
-                const items = await api(`/inventory/${warehouse.id}/products`);
+                const items = itemsByWarehouse.get(String(warehouse.id)) || [];
                 const totalProducts = items.reduce((sum, item) => sum + Number(item.menge || 0), 0);
                 inventoryByWarehouse.push({
                     name: warehouse.lagername,
@@ -107,6 +107,7 @@ class PostgresRepository:
                     )
                     """
                 )
+                cur.execute("CREATE INDEX IF NOT EXISTS inventory_produkt_id_idx ON inventory (produkt_id)")
             self.conn.commit()
         except psycopg2.Error:
             self.conn.rollback()
@@ -155,6 +156,27 @@ class PostgresRepository:
             self.conn.rollback()
             raise
 
+    def find_fields_by_id(self, table: str, document_id: str, fields: list):
+        """Retrieve selected columns of a single record by its unique ID.
+
+        Args:
+            table (str): The name of the database table.
+            document_id (str): The unique identifier of the record.
+            fields (list): The column names to select.
+
+        Returns:
+            dict | None: The selected columns if found, otherwise None.
+        """
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                query = f"SELECT {', '.join(fields)} FROM {table} WHERE id = %s"
+                cur.execute(query, (document_id,))
+                result = cur.fetchone()
+                return dict(result) if result else None
+        except psycopg2.Error:
+            self.conn.rollback()
+            raise
+
     def find_all(self, table: str):
         """Retrieve all records from a specified table.
 
@@ -174,6 +196,77 @@ class PostgresRepository:
             self.conn.rollback()
             raise
 
+    def find_many_by_ids(self, table: str, document_ids: list):
+        """Retrieve all records of a table whose ID is in the given list.
+
+        Resolves the whole list in a single query instead of one
+        ``find_by_id`` round-trip per ID. IDs that are not numeric cannot
+        match a row and are skipped, so they do not fail the whole batch.
+
+        Args:
+            table (str): The name of the database table.
+            document_ids (list): The unique identifiers of the records.
+
+        Returns:
+            list[dict]: A list of dictionaries representing the found records.
+        """
+        numeric_ids = [str(document_id) for document_id in document_ids if str(document_id).isdigit()]
+        if not numeric_ids:
+            return []
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                query = f"SELECT * FROM {table} WHERE id = ANY(%s::int[])"
+                cur.execute(query, (numeric_ids,))
+                results = cur.fetchall()
+                return [dict(row) for row in results]
+        except psycopg2.Error:
+            self.conn.rollback()
+            raise
+
+    def find_page(self, table: str, limit: int, offset: int = 0):
+        """Retrieve one page of records from a table ordered by ID.
+
+        Args:
+            table (str): The name of the database table.
+            limit (int): The maximum number of records to return.
+            offset (int): The number of records to skip.
+
+        Returns:
+            list[dict]: A list of dictionaries representing the records on the page.
+        """
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                query = f"SELECT * FROM {table} ORDER BY id LIMIT %s OFFSET %s"
+                cur.execute(query, (limit, offset))
+                results = cur.fetchall()
+                return [dict(row) for row in results]
+        except psycopg2.Error:
+            self.conn.rollback()
+            raise
+
+    def find_where(self, table: str, criteria: dict):
+        """Retrieve all records from a table whose columns equal the given values.
+
+        Args:
+            table (str): The name of the database table.
+            criteria (dict): Column names mapped to the values they must match.
+
+        Returns:
+            list[dict]: A list of dictionaries representing the matching records.
+        """
+        if not criteria:
+            return self.find_all(table)
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                where_clause = " AND ".join([f"{k} = %s" for k in criteria.keys()])
+                query = f"SELECT * FROM {table} WHERE {where_clause}"
+                cur.execute(query, list(criteria.values()))
+                results = cur.fetchall()
+                return [dict(row) for row in results]
+        except psycopg2.Error:
+            self.conn.rollback()
+            raise
+
     def update(self, table: str, document_id: str, data: dict) -> bool:
         """Update fields of an existing record in a table.
 
@@ -219,4 +312,57 @@ class PostgresRepository:
             self.conn.rollback()
             raise
 
-        
\ No newline at end of file
+        
+
+    def aggregate_inventory_stats(self) -> dict:
+        """Sum inventory quantities per warehouse and per product inside the database.
+
+        Returns:
+            dict: Totals keyed by `warehouses` and `products`, each mapping an ID (as str) to its quantity.
+        """
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute("SELECT lager_id, SUM(menge) FROM inventory GROUP BY lager_id")
+                warehouses = {str(lager_id): int(total) for lager_id, total in cur.fetchall()}
+                cur.execute("SELECT produkt_id, SUM(menge) FROM inventory GROUP BY produkt_id")
+                products = {str(produkt_id): int(total) for produkt_id, total in cur.fetchall()}
+            return {"warehouses": warehouses, "products": products}
+        except psycopg2.Error:
+            self.conn.rollback()
+            raise
+
+    def aggregate_statistics(self) -> dict:
+        """Count products and warehouses and sum all stocked units in one query.
+
+        Returns:
+            dict: `total_products`, `total_warehouses` and `total_stock_units` as integers.
+        """
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    "SELECT (SELECT COUNT(*) FROM products), "
+                    "(SELECT COUNT(*) FROM warehouses), "
+                    "(SELECT COALESCE(SUM(menge), 0) FROM inventory)"
+                )
+                total_products, total_warehouses, total_stock = cur.fetchone()
+            return {"total_products": int(total_products), "total_warehouses": int(total_warehouses), "total_stock_units": int(total_stock)}
+        except psycopg2.Error:
+            self.conn.rollback()
+            raise
+
+    def count(self, table: str) -> int:
+        """Count the records of a table.
+
+        Args:
+            table (str): The name of the database table.
+
+        Returns:
+            int: Number of records.
+        """
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(f"SELECT COUNT(*) FROM {table}")
+                return int(cur.fetchone()[0])
+        except psycopg2.Error:
+            self.conn.rollback()
+            raise
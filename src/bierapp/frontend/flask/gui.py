@@ -2,23 +2,36 @@
 
 import os
 import io
-import tempfile
-import pathlib
+from collections import defaultdict
+from operator import itemgetter
 
-from flask import Flask, render_template, jsonify, request, send_from_directory, send_file
+from flask import Flask, g, render_template, jsonify, request, send_from_directory, send_file
 
 from bierapp.backend.service.product_service import ProductService, InventoryService
 from bierapp.backend.service.warehouse_service import WarehouseService
 
+RESOURCES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "resources"))
+STYLES_DIR = os.path.join(RESOURCES_DIR, "stylesheets")
+PICTURES_DIR = os.path.join(RESOURCES_DIR, "pictures")
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "controller"))
+
+_UNKNOWN_PRODUCT_META = {"preis": 0.0, "waehrung": "EUR", "lieferant": "Unbekannt", "einheit": "Stk"}
+_BY_TOTAL = itemgetter(1)
+
 
 def _theme_options() -> list[str]:
     """Return available stylesheet filenames.
 
+    The directory is listed at most once per request; the result is kept on `flask.g`.
+
     Returns:
         list[str]: Sorted list of available `.css` themes.
     """
-    styles_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "resources", "stylesheets"))
-    return sorted([name for name in os.listdir(styles_dir) if name.endswith(".css")])
+    options = getattr(g, "theme_options", None)
+    if options is None:
+        options = sorted([name for name in os.listdir(STYLES_DIR) if name.endswith(".css")])
+        g.theme_options = options
+    return options
 
 
 def _theme_labels() -> dict[str, str]:
@@ -37,6 +50,29 @@ def _theme_labels() -> dict[str, str]:
     }
 
 
+_EMPTY_STATS = {
+    "warehouses": 0,
+    "products": 0,
+    "capacity": 0,
+    "free_capacity": 0,
+    "avg_util": 0,
+    "active_warehouses": 0,
+    "total_inventory_value": 0,
+    "main_currency": "-",
+    "top_product": None,
+    "max_util": None,
+    "top_supplier": None,
+    "total_attributes": 0,
+    "warehouse_rows": [],
+    "utilization_rows": [],
+    "top_products": [],
+    "currency_rows": [],
+    "unit_rows": [],
+    "supplier_rows": [],
+    "attribute_rows": [],
+}
+
+
 def _selected_theme() -> str:
     """Resolve the currently selected theme from the request query.
 
@@ -131,26 +167,17 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         except TypeError as exc:
             raise NotImplementedError("Report B is not fully implemented in colleague code") from exc
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            output_path = pathlib.Path(tmp.name)
-
-        try:
-            report_runner.generate_report(output_path=output_path)
-
-            pdf_bytes = output_path.read_bytes()
-            buffer = io.BytesIO(pdf_bytes)
-            buffer.seek(0)
-            return buffer, filename
-        finally:
-            try:
-                output_path.unlink(missing_ok=True)
-            except Exception:
-                pass
+        buffer = io.BytesIO()
+        report_runner.generate_report(output_path=buffer)
+        buffer.seek(0)
+        return buffer, filename
 
     def _build_stats() -> dict:
         warehouses = warehouse_service.list_warehouses()
         products = product_service.list_products()
-        inventory_rows = inventory_service.db.find_all("inventory")
+        if not warehouses and not products:
+            return dict(_EMPTY_STATS)
+        inventory_totals = inventory_service.db.aggregate_inventory_stats()
 
         product_meta = {
             str(product.get("id")): {
@@ -164,16 +191,16 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         }
 
         warehouse_rows = []
-        product_totals: dict[str, int] = {}
-        currency_totals: dict[str, float] = {}
-        unit_totals: dict[str, int] = {}
-        supplier_totals: dict[str, int] = {}
-        attribute_totals: dict[str, int] = {}
+        warehouse_totals: dict[str, int] = inventory_totals["warehouses"]
+        product_totals: dict[str, int] = inventory_totals["products"]
+        currency_totals: defaultdict[str, float] = defaultdict(float)
+        unit_totals: defaultdict[str, int] = defaultdict(int)
+        supplier_totals: defaultdict[str, int] = defaultdict(int)
+        attribute_totals: defaultdict[str, int] = defaultdict(int)
 
         for warehouse in warehouses:
             wid = str(warehouse.get("id"))
-            items = [row for row in inventory_rows if str(row.get("lager_id")) == wid]
-            total_products = sum(int(row.get("menge") or 0) for row in items)
+            total_products = warehouse_totals.get(wid, 0)
             capacity = int(warehouse.get("max_plaetze") or 0)
             util = (total_products / capacity) if capacity > 0 else 0
 
@@ -187,21 +214,11 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
                 }
             )
 
-            for row in items:
-                product_id = str(row.get("produkt_id"))
-                qty = int(row.get("menge") or 0)
-                product_totals[product_id] = product_totals.get(product_id, 0) + qty
-
-                meta = product_meta.get(product_id, {
-                    "name": f"Produkt {product_id}",
-                    "preis": 0.0,
-                    "waehrung": "EUR",
-                    "lieferant": "Unbekannt",
-                    "einheit": "Stk",
-                })
-                currency_totals[meta["waehrung"]] = currency_totals.get(meta["waehrung"], 0.0) + meta["preis"] * qty
-                unit_totals[meta["einheit"]] = unit_totals.get(meta["einheit"], 0) + qty
-                supplier_totals[meta["lieferant"]] = supplier_totals.get(meta["lieferant"], 0) + qty
+        for product_id, qty in product_totals.items():
+            meta = product_meta.get(product_id, _UNKNOWN_PRODUCT_META)
+            currency_totals[meta["waehrung"]] += meta["preis"] * qty
+            unit_totals[meta["einheit"]] += qty
+            supplier_totals[meta["lieferant"]] += qty
 
         for product in products:
             for attribute in product.get("attributes") or []:
@@ -210,10 +227,10 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
                 attribute_name = str(attribute.get("name") or attribute.get("label") or "").strip()
                 if not attribute_name:
                     continue
-                attribute_totals[attribute_name] = attribute_totals.get(attribute_name, 0) + 1
+                attribute_totals[attribute_name] += 1
 
-        warehouse_rows.sort(key=lambda item: item["products"], reverse=True)
-        utilization_rows = sorted(warehouse_rows, key=lambda item: item["util"], reverse=True)
+        warehouse_rows.sort(key=itemgetter("products"), reverse=True)
+        utilization_rows = sorted(warehouse_rows, key=itemgetter("util"), reverse=True)
         top_products = sorted(
             (
                 {
@@ -222,13 +239,13 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
                 }
                 for product_id, qty in product_totals.items()
             ),
-            key=lambda item: item["qty"],
+            key=itemgetter("qty"),
             reverse=True,
         )
-        currency_rows = sorted(currency_totals.items(), key=lambda item: item[1], reverse=True)
-        unit_rows = sorted(unit_totals.items(), key=lambda item: item[1], reverse=True)
-        supplier_rows = sorted(supplier_totals.items(), key=lambda item: item[1], reverse=True)
-        attribute_rows = sorted(attribute_totals.items(), key=lambda item: item[1], reverse=True)
+        currency_rows = sorted(currency_totals.items(), key=_BY_TOTAL, reverse=True)
+        unit_rows = sorted(unit_totals.items(), key=_BY_TOTAL, reverse=True)
+        supplier_rows = sorted(supplier_totals.items(), key=_BY_TOTAL, reverse=True)
+        attribute_rows = sorted(attribute_totals.items(), key=_BY_TOTAL, reverse=True)
 
         total_warehouses = len(warehouses)
         total_products = sum(item["products"] for item in warehouse_rows)
@@ -265,6 +282,15 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
             "attribute_rows": attribute_rows,
         }
 
+    @app.context_processor
+    def inject_theme() -> dict:
+        """Provide the theme selection to every rendered template.
+
+        Returns:
+            dict: The selected theme, all available themes and their labels.
+        """
+        return {"selected_theme": _selected_theme(), "theme_options": _theme_options(), "theme_labels": _theme_labels()}
+
     @app.route("/stylesheets/<path:filename>", endpoint="stylesheet", methods=["GET"])
     def stylesheet(filename: str):
         """Serve a stylesheet file from the resources directory.
@@ -275,14 +301,12 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         Returns:
             Response: The requested stylesheet file.
         """
-        styles_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "resources", "stylesheets"))
-        return send_from_directory(styles_dir, filename)
+        return send_from_directory(STYLES_DIR, filename)
 
     @app.route("/pictures/<path:filename>", endpoint="picture", methods=["GET"])
     def picture(filename: str):
         """Serve image assets from the resources pictures directory."""
-        pictures_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "resources", "pictures"))
-        return send_from_directory(pictures_dir, filename)
+        return send_from_directory(PICTURES_DIR, filename)
 
     @app.route("/scripts/app.js", endpoint="app_script", methods=["GET"])
     def app_script():
@@ -291,8 +315,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         Returns:
             Response: The shared `app.js` frontend script.
         """
-        script_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "controller"))
-        return send_from_directory(script_dir, "app.js")
+        return send_from_directory(SCRIPTS_DIR, "app.js")
 
     @app.route("/", methods=["GET"])
     def index():
@@ -301,13 +324,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         Returns:
             str: Rendered HTML template for the main dashboard.
         """
-        selected_theme = _selected_theme()
-        return render_template(
-            "index.html",
-            selected_theme=selected_theme,
-            theme_options=_theme_options(),
-            theme_labels=_theme_labels(),
-        )
+        return render_template("index.html")
 
     @app.route("/page1", methods=["GET"])
     def page1():
@@ -316,13 +333,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         Returns:
             str: Rendered HTML template for product editing.
         """
-        selected_theme = _selected_theme()
-        return render_template(
-            "page1.html",
-            selected_theme=selected_theme,
-            theme_options=_theme_options(),
-            theme_labels=_theme_labels(),
-        )
+        return render_template("page1.html")
 
     @app.route("/page2", methods=["GET"])
     def page2():
@@ -331,13 +342,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         Returns:
             str: Rendered HTML template for warehouse overview.
         """
-        selected_theme = _selected_theme()
-        return render_template(
-            "page2.html",
-            selected_theme=selected_theme,
-            theme_options=_theme_options(),
-            theme_labels=_theme_labels(),
-        )
+        return render_template("page2.html")
 
     @app.route("/page3", methods=["GET"])
     def page3():
@@ -346,15 +351,8 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         Returns:
             str: Rendered HTML template for statistics dashboard.
         """
-        selected_theme = _selected_theme()
         stats = _build_stats()
-        return render_template(
-            "page3.html",
-            selected_theme=selected_theme,
-            theme_options=_theme_options(),
-            theme_labels=_theme_labels(),
-            stats=stats,
-        )
+        return render_template("page3.html", stats=stats)
 
     @app.route("/page4", methods=["GET"])
     def page4():
@@ -363,13 +361,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         Returns:
             str: Rendered HTML template for change history.
         """
-        selected_theme = _selected_theme()
-        return render_template(
-            "page4.html",
-            selected_theme=selected_theme,
-            theme_options=_theme_options(),
-            theme_labels=_theme_labels(),
-        )
+        return render_template("page4.html")
 
     @app.route("/page5", methods=["GET"])
     def page5():
@@ -378,13 +370,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         Returns:
             str: Rendered HTML template for managing products within a warehouse.
         """
-        selected_theme = _selected_theme()
-        return render_template(
-            "page5.html",
-            selected_theme=selected_theme,
-            theme_options=_theme_options(),
-            theme_labels=_theme_labels(),
-        )
+        return render_template("page5.html")
 
     @app.route("/page6", methods=["GET"])
     def page6():
@@ -393,13 +379,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         Returns:
             str: Rendered HTML template for report preview and download.
         """
-        selected_theme = _selected_theme()
-        return render_template(
-            "page6.html",
-            selected_theme=selected_theme,
-            theme_options=_theme_options(),
-            theme_labels=_theme_labels(),
-        )
+        return render_template("page6.html")
 
     @app.route("/reports/<report_key>/preview", methods=["GET"])
     def preview_report(report_key: str):
@@ -446,11 +426,20 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
     def get_products():
         """Retrieve all products from the inventory.
 
+        The optional `limit` and `offset` query parameters return one page ordered by ID.
+
         Returns:
             tuple: JSON response with products list and HTTP 200 status.
+
+        Raises:
+            400: If `limit` or `offset` is negative.
         """
+        limit = request.args.get("limit", type=int)
+        offset = request.args.get("offset", 0, type=int)
+        if (limit is not None and limit < 0) or offset < 0:
+            return jsonify({"error": "limit and offset must not be negative"}), 400
         try:
-            products = product_service.list_products()
+            products = product_service.list_products(limit=limit, offset=offset)
             return jsonify(products), 200
         except Exception as exc:
             return jsonify({"error": "Failed to retrieve products", "details": str(exc)}), 500
@@ -564,7 +553,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         try:
             existing = None
             try:
-                existing = product_service.get_product(str(produkt_id))
+                existing = inventory_service.db.find_fields_by_id("products", str(produkt_id), ["name"])
             except Exception:
                 existing = None
             product_service.delete_product(str(produkt_id))
@@ -588,9 +577,9 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         """
         try:
             warehouses = warehouse_service.list_warehouses()
-            inventory = inventory_service.db.find_all("inventory")
+            totals = inventory_service.db.aggregate_inventory_stats()["warehouses"]
             for w in warehouses:
-                w["products"] = sum(item["menge"] for item in inventory if item["lager_id"] == w["id"])
+                w["products"] = totals.get(str(w["id"]), 0)
             return jsonify(warehouses), 200
         except Exception as exc:
             return jsonify({"error": "Failed to retrieve warehouses", "details": str(exc)}), 500
@@ -636,7 +625,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         try:
             existing = None
             try:
-                existing = warehouse_service.get_warehouse(str(lager_id))
+                existing = inventory_service.db.find_fields_by_id("warehouses", str(lager_id), ["lagername", "adresse"])
             except Exception:
                 existing = None
             warehouse_service.delete_warehouse(str(lager_id))
@@ -692,6 +681,21 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         except Exception as exc:
             return jsonify({"error": "Failed to update warehouse", "details": str(exc)}), 500
 
+    @app.route("/inventory", methods=["GET"])
+    def get_all_inventory():
+        """Retrieve every inventory entry of all warehouses in a single query.
+
+        Returns:
+            tuple: JSON response with inventory items and HTTP 200 status.
+
+        Raises:
+            500: If retrieval fails.
+        """
+        try:
+            return jsonify(inventory_service.db.find_all("inventory")), 200
+        except Exception as exc:
+            return jsonify({"error": "Failed to retrieve inventory", "details": str(exc)}), 500
+
     @app.route("/inventory", methods=["POST"])
     def add_inventory():
         """Add a product to warehouse inventory.
@@ -768,14 +772,13 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
             if menge <= 0:
                 return jsonify({"error": "menge must be a positive integer"}), 400
 
-            source_rows = inventory_service.list_inventory(source_lager_id)
-            source_item = next((item for item in source_rows if int(item.get("produkt_id")) == produkt_id), None)
+            product_rows = inventory_service.db.find_where("inventory", {"produkt_id": produkt_id})
+            source_item = next((item for item in product_rows if int(item.get("lager_id")) == source_lager_id), None)
             source_qty = int(source_item.get("menge", 0)) if source_item else 0
             if source_qty < menge:
                 return jsonify({"error": "Not enough stock in source warehouse"}), 400
 
-            target_rows = inventory_service.list_inventory(target_lager_id)
-            target_item = next((item for item in target_rows if int(item.get("produkt_id")) == produkt_id), None)
+            target_item = next((item for item in product_rows if int(item.get("lager_id")) == target_lager_id), None)
             target_qty = int(target_item.get("menge", 0)) if target_item else 0
 
             inventory_service.set_quantity(source_lager_id, produkt_id, source_qty - menge)
@@ -810,9 +813,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
         """Retrieve all inventory entries for a given product."""
 
         try:
-            inventory = inventory_service.db.find_all("inventory")
-            produkt_id_int = int(produkt_id)
-            product_inventory = [item for item in inventory if int(item["produkt_id"]) == produkt_id_int]
+            product_inventory = inventory_service.db.find_where("inventory", {"produkt_id": int(produkt_id)})
             return jsonify(product_inventory), 200
         except Exception as exc:
             return jsonify({"error": "Failed to retrieve product inventory", "details": str(exc)}), 500
@@ -831,8 +832,7 @@ def register_routes(app: Flask, product_service: ProductService, warehouse_servi
             500: If retrieval fails.
         """
         try:
-            inventory = inventory_service.db.find_all("inventory")
-            warehouse_inventory = [item for item in inventory if item["lager_id"] == int(lager_id)]
+            warehouse_inventory = inventory_service.db.find_where("inventory", {"lager_id": int(lager_id)})
             return jsonify(warehouse_inventory), 200
         except Exception as exc:
             return jsonify({"error": "Failed to retrieve warehouse inventory", "details": str(exc)}), 500
@@ -1,5 +1,7 @@
-from typing import List, Dict, Optional, Tuple
+from typing import BinaryIO, List, Dict, Optional, Tuple, Union
 from collections import defaultdict
+from operator import itemgetter
+import heapq
 import pathlib
 import shlex
 from datetime import datetime
@@ -12,6 +14,8 @@ from reports.report_format import create_cover_page, create_table_pages, create_
 
 
 DEFAULT_OUTPUT_FILE = pathlib.Path("report_a.pdf")
+TABLE_HEADERS = ['Datum', 'Von->Zu', 'Produkt', 'Vorher', 'Änderung', 'Nachher']
+PRODUCT_NAME_KEYS = ('product_name', 'produkt_name', 'name', 'title', 'product')
 
 
 class ReportAHelpers:
@@ -36,17 +40,11 @@ class ReportAHelpers:
             i += 1
         if i >= len(s):
             return None
-        num_chars = []
-        if allow_negative and s[i] == '-':
-            num_chars.append('-')
-            i += 1
-        while i < len(s) and s[i].isdigit():
-            num_chars.append(s[i])
-            i += 1
-        if not num_chars or (num_chars == ['-']):
-            return None
+        end = i + 1 if allow_negative and s[i] == '-' else i
+        while end < len(s) and s[end].isdigit():
+            end += 1
         try:
-            return int(''.join(num_chars))
+            return int(s[i:end])
         except Exception:
             return None
 
@@ -77,15 +75,11 @@ class ReportAHelpers:
             i += 1
         if i >= len(s):
             return None
-        num_chars = []
-        if s[i] == '-':
-            num_chars.append('-')
-            i += 1
-        while i < len(s) and s[i].isdigit():
-            num_chars.append(s[i])
-            i += 1
+        end = i + 1 if s[i] == '-' else i
+        while end < len(s) and s[end].isdigit():
+            end += 1
         try:
-            return int(''.join(num_chars))
+            return int(s[i:end])
         except Exception:
             return None
 
@@ -323,6 +317,20 @@ class ReportAHelpers:
         except Exception:
             return str(ts)
 
+    @staticmethod
+    def to_epoch(v) -> float:
+        """Return `v` as epoch seconds for sorting; unknown timestamps sort last."""
+        if v is None:
+            return float("inf")
+        try:
+            d = v if isinstance(v, datetime) else datetime.fromisoformat(str(v))
+            return d.timestamp()
+        except Exception:
+            try:
+                return float(v)
+            except Exception:
+                return float("inf")
+
     @staticmethod
     def is_relevant(parsed: Dict) -> bool:
         action = (parsed.get("action") or "").lower()
@@ -457,8 +465,7 @@ class ReportAHelpers:
             except Exception:
                 direction = loc
             rows.append([t, direction, pname, f"{prev_disp:g}", f"{qty:g}", f"{curr_disp:g}"])
-        headers = ['Datum', 'Von->Zu', 'Produkt', 'Vorher', 'Änderung', 'Nachher']
-        return headers, rows
+        return TABLE_HEADERS, rows
 
 
 def _find_all_ints_after_key(details: str, key: str) -> List[int]:
@@ -493,6 +500,10 @@ def _format_ts(ts) -> str:
     return ReportAHelpers.format_ts(ts)
 
 
+def _to_epoch(v) -> float:
+    return ReportAHelpers.to_epoch(v)
+
+
 def _is_relevant(parsed: Dict) -> bool:
     return ReportAHelpers.is_relevant(parsed)
 
@@ -533,44 +544,22 @@ class ReportA(ReportPort):
             except Exception:
                 return "Nicht angegeben"
 
-    def generate_report(self, output_path: pathlib.Path = DEFAULT_OUTPUT_FILE) -> Dict:
+    def generate_report(self, output_path: Union[pathlib.Path, BinaryIO] = DEFAULT_OUTPUT_FILE) -> Dict:
         try:
             if getattr(self.db, 'connect', None):
                 self.db.connect()
         except Exception:
             self.db = None
 
-        try:
-            history_rows = self.db.find_all('history') if getattr(self, 'db', None) else []
-        except Exception:
-            history_rows = []
-
-        parsed = [_parse_history_row(r) for r in history_rows]
-
-        def _to_dt(v):
-            if v is None:
-                return datetime.max
-            if isinstance(v, datetime):
-                return v
-            try:
-                return datetime.fromisoformat(str(v))
-            except Exception:
-                try:
-                    return datetime.fromtimestamp(float(v))
-                except Exception:
-                    return datetime.max
-
-        parsed.sort(key=lambda x: _to_dt(x.get('timestamp')))
-        filtered = [p for p in parsed if _is_relevant(p)]
+        filtered = self._relevant_history()
 
        
         product_names: Dict[str, str] = {}
         pids_to_fetch = set()
-        name_keys = ('product_name', 'produkt_name', 'name', 'title', 'product')
         for p in filtered:
             pid = p.get('product_id')
             raw = p.get('raw') or {}
-            pname = next((str(raw.get(k)) for k in name_keys if raw.get(k)), None) or _extract_name(p.get('details') or '')
+            pname = next((str(raw.get(k)) for k in PRODUCT_NAME_KEYS if raw.get(k)), None) or _extract_name(p.get('details') or '')
             if not pname and pid:
                 pids_to_fetch.add(str(pid))
             if pid and pname:
@@ -600,8 +589,8 @@ class ReportA(ReportPort):
             if lid:
                 warehouse_net[str(lid)] += qty
 
-        top_sales = sorted(sales.items(), key=lambda x: x[1], reverse=True)[:10]
-        bottom_sales = sorted(sales.items(), key=lambda x: x[1])[:10]
+        top_sales = heapq.nlargest(10, sales.items(), key=itemgetter(1))
+        bottom_sales = heapq.nsmallest(10, sales.items(), key=itemgetter(1))
 
         
         try:
@@ -624,128 +613,107 @@ class ReportA(ReportPort):
 
         return {"output": str(output_path), "summary": {"total_filtered": len(table_rows), "top_count": len(top_sales), "bottom_count": len(bottom_sales)}, "generated": datetime.now().isoformat()}
 
-    def inventory_report(self, lager_id: str) -> List[Dict]:
-        """Return current inventory for a given warehouse id.
-
-        Builds running totals from history and aggregates by product for the
-        specified `lager_id`.
-        """
+    def _relevant_history(self) -> List[Dict]:
+        """Load, parse and chronologically sort the relevant history rows once."""
         try:
             rows = self.db.find_all('history') if getattr(self, 'db', None) else []
         except Exception:
             rows = []
 
         parsed = [_parse_history_row(r) for r in rows]
+        parsed.sort(key=lambda x: _to_epoch(x.get('timestamp')))
+        return [p for p in parsed if _is_relevant(p)]
 
-        def _to_dt(v):
-            if v is None:
-                return datetime.max
-            if isinstance(v, datetime):
-                return v
-            try:
-                return datetime.fromisoformat(str(v))
-            except Exception:
-                try:
-                    return datetime.fromtimestamp(float(v))
-                except Exception:
-                    return datetime.max
+    def _inventory_totals(self, lager_ids: List[str], filtered: List[Dict]) -> Dict[str, Dict[str, float]]:
+        """Aggregate the quantities per product for every id in `lager_ids` in one pass over the history.
 
-        parsed.sort(key=lambda x: _to_dt(x.get('timestamp')))
-        filtered = [p for p in parsed if _is_relevant(p)]
-
-        inv: Dict[str, float] = {}
-        lid_str = str(lager_id)
+        Each row only touches the warehouses it names (lager_id, source/target,
+        `lager_id=` details), so the cost does not grow with the number of warehouses.
+        """
+        totals: Dict[str, Dict[str, float]] = {str(lid): {} for lid in lager_ids}
         for p in filtered:
             pid = p.get('product_id')
             if not pid:
                 continue
             qty = float(p.get('quantity') or 0)
             raw = p.get('raw') or {}
+            lid_str = str(p.get('lager_id'))
 
-           
-            if str(p.get('lager_id')) == lid_str:
-                inv[pid] = inv.get(pid, 0.0) + qty
-                continue
-
+            src = dst = None
             try:
                 src = raw.get('from') or raw.get('source_lager') or raw.get('source')
                 dst = raw.get('to') or raw.get('target_lager') or raw.get('target')
-                if src is not None and str(src) == lid_str:
-                    inv[pid] = inv.get(pid, 0.0) - qty
-                    continue
-                if dst is not None and str(dst) == lid_str:
-                    inv[pid] = inv.get(pid, 0.0) + qty
-                    continue
             except Exception:
                 pass
+            src_str = str(src) if src is not None else None
+            dst_str = str(dst) if dst is not None else None
 
-          
             try:
-                lids = _find_all_ints_after_key(p.get('details') or '', 'lager_id=')
-                for ids in lids:
-                    if str(ids) == lid_str:
-                        inv[pid] = inv.get(pid, 0.0) + qty
-                        break
+                detail_ids = {str(i) for i in _find_all_ints_after_key(p.get('details') or '', 'lager_id=')}
             except Exception:
-                pass
+                detail_ids = set()
+
+            for wid in {lid_str, src_str, dst_str} | detail_ids:
+                inv = totals.get(wid)
+                if inv is None:
+                    continue
+                if wid != lid_str and wid == src_str:
+                    inv[pid] = inv.get(pid, 0.0) - qty
+                else:
+                    inv[pid] = inv.get(pid, 0.0) + qty
+        return totals
+
+    def inventory_reports(self, lager_ids: List[str]) -> Dict[str, List[Dict]]:
+        """Return the current inventory for several warehouses at once.
+
+        The history and the product names are fetched a single time and
+        shared between all requested warehouses.
+        """
+        totals = self._inventory_totals(lager_ids, self._relevant_history())
 
         product_names: Dict[str, str] = {}
+        product_ids = {pid for inv in totals.values() for pid in inv}
         try:
-            if getattr(self, 'db', None) and getattr(self.db, 'find_many_by_ids', None):
-                rows = self.db.find_many_by_ids('products', list(inv.keys()))
-                for r in rows or []:
-                    pid = r.get('id')
-                    if pid is None:
-                        continue
-                    name = r.get('name')
-                    if name:
-                        product_names[str(pid)] = name
+            if product_ids and getattr(self, 'db', None) and getattr(self.db, 'find_many_by_ids', None):
+                rows = self.db.find_many_by_ids('products', list(product_ids))
+                product_names = {str(r.get('id')): r.get('name') for r in rows or [] if r.get('id') is not None and r.get('name')}
         except Exception:
             pass
 
-        out: List[Dict] = []
-        for pid, amt in inv.items():
-            out.append({'product_id': str(pid), 'product_name': product_names.get(str(pid)) or f'Produkt {pid}', 'menge': amt})
-        return out
+        return {
+            lid: [{'product_id': str(pid), 'product_name': product_names.get(str(pid)) or f'Produkt {pid}', 'menge': amt} for pid, amt in inv.items()]
+            for lid, inv in totals.items()
+        }
+
+    def inventory_report(self, lager_id: str) -> List[Dict]:
+        """Return current inventory for a given warehouse id.
+
+        Builds running totals from history and aggregates by product for the
+        specified `lager_id`.
+        """
+        return self.inventory_reports([lager_id])[str(lager_id)]
 
     def statistics_report(self) -> Dict:
         """Return aggregated statistics matching `ReportPort` expectations."""
         stats = {'total_products': 0, 'total_warehouses': 0, 'total_stock_units': 0}
+        whs: List[Dict] = []
         try:
             if getattr(self, 'db', None):
-                prods = self.db.find_all('products') or []
                 whs = self.db.find_all('warehouses') or []
-                stats['total_products'] = len(prods)
+                stats['total_products'] = self.db.count('products')
                 stats['total_warehouses'] = len(whs)
         except Exception:
             pass
 
         try:
-            total = 0.0
-            wh_ids = []
-            try:
-                whs = self.db.find_all('warehouses') or []
-                for w in whs:
-                    wid = w.get('id') or w.get('lager_id')
-                    if wid is not None:
-                        wh_ids.append(str(wid))
-            except Exception:
-                wh_ids = []
-
-            for wid in wh_ids:
-                inv = self.inventory_report(wid)
-                for item in inv:
-                    try:
-                        total += float(item.get('menge') or 0)
-                    except Exception:
-                        pass
-            stats['total_stock_units'] = total
+            wh_ids = [str(wid) for wid in (w.get('id') or w.get('lager_id') for w in whs) if wid is not None]
+            filtered = self._relevant_history() if wh_ids else []
+            stats['total_stock_units'] = sum((sum(inv.values()) for inv in self._inventory_totals(wh_ids, filtered).values()), 0.0)
         except Exception:
             pass
 
         return stats
 
-
 if __name__ == "__main__":
     import sys
     arg = sys.argv[1] if len(sys.argv) > 1 else None
@@ -1,11 +1,12 @@
-from typing import List, Dict, Optional, Tuple
+from typing import BinaryIO, List, Dict, Optional, Tuple, Union
 from matplotlib.backends.backend_pdf import PdfPages
 from collections import defaultdict
+from operator import itemgetter
+import heapq
 import pathlib
 import shlex
 import json
 from datetime import datetime
-from matplotlib import pyplot as plt
 
 from bierapp.db.postgress import PostgresRepository
 from bierapp.contracts import ReportPort
@@ -31,17 +32,11 @@ def _find_int_after_key(details: str, key: str, allow_negative: bool = False) ->
         i += 1
     if i >= len(s):
         return None
-    num_chars = []
-    if allow_negative and s[i] == '-':
-        num_chars.append('-')
-        i += 1
-    while i < len(s) and s[i].isdigit():
-        num_chars.append(s[i])
-        i += 1
-    if not num_chars or (num_chars == ['-']):
-        return None
+    end = i + 1 if allow_negative and s[i] == '-' else i
+    while end < len(s) and s[end].isdigit():
+        end += 1
     try:
-        return int(''.join(num_chars))
+        return int(s[i:end])
     except Exception:
         return None
 
@@ -72,15 +67,11 @@ def _first_int_in_slice(s: str) -> Optional[int]:
         i += 1
     if i >= len(s):
         return None
-    num_chars = []
-    if s[i] == '-':
-        num_chars.append('-')
-        i += 1
-    while i < len(s) and s[i].isdigit():
-        num_chars.append(s[i])
-        i += 1
+    end = i + 1 if s[i] == '-' else i
+    while end < len(s) and s[end].isdigit():
+        end += 1
     try:
-        return int(''.join(num_chars))
+        return int(s[i:end])
     except Exception:
         return None
 
@@ -288,18 +279,17 @@ def _format_ts(ts) -> str:
         return str(ts)
 
 
-def _to_dt(v):
+def _to_epoch(v) -> float:
     if v is None:
-        return datetime.max
-    if isinstance(v, datetime):
-        return v
+        return float("inf")
     try:
-        return datetime.fromisoformat(str(v))
+        d = v if isinstance(v, datetime) else datetime.fromisoformat(str(v))
+        return d.timestamp()
     except Exception:
         try:
-            return datetime.fromtimestamp(float(v))
+            return float(v)
         except Exception:
-            return datetime.max
+            return float("inf")
 
 
 def _is_relevant(parsed: Dict) -> bool:
@@ -340,7 +330,7 @@ class ReportB(ReportPort):
             self.report_a = None
             self.warehouses = {}
 
-    def generate_report(self, output_path: pathlib.Path = DEFAULT_OUTPUT_FILE) -> Dict:
+    def generate_report(self, output_path: Union[pathlib.Path, BinaryIO] = DEFAULT_OUTPUT_FILE) -> Dict:
         report_a = self.report_a or (ReportA(self.db) if ReportA else None)
 
         try:
@@ -350,7 +340,7 @@ class ReportB(ReportPort):
 
         parsed = [_parse_history_row(r) for r in history_rows]
 
-        parsed.sort(key=lambda x: _to_dt(x.get("timestamp")))
+        parsed.sort(key=lambda x: _to_epoch(x.get("timestamp")))
         filtered = [p for p in parsed if _is_relevant(p)]
 
         product_names: Dict[str, str] = {}
@@ -394,8 +384,8 @@ class ReportB(ReportPort):
             if lid:
                 warehouse_net[str(lid)] += qty
 
-        top_movements = sorted(movements.items(), key=lambda x: x[1], reverse=True)[:10]
-        bottom_movements = sorted(movements.items(), key=lambda x: x[1])[:10]
+        top_movements = heapq.nlargest(10, movements.items(), key=itemgetter(1))
+        bottom_movements = heapq.nsmallest(10, movements.items(), key=itemgetter(1))
 
         table_rows: List[List[str]] = []
         running: Dict[Tuple[str, str], float] = defaultdict(float)
@@ -467,8 +457,6 @@ class ReportB(ReportPort):
 
             table_rows.append([time_str, direction, pname, f"{prev_disp:g}", f"{qty:g}", f"{curr_disp:g}"])
 
-        headers = ["Datum", "Von->Zu", "Produkt", "Vorher", "Änderung", "Nachher"]
-
         top_names = [product_names.get(str(pid)) or str(pid) for pid, _ in top_movements]
         top_values = [v for _, v in top_movements]
         bottom_names = [product_names.get(str(pid)) or str(pid) for pid, _ in bottom_movements]
@@ -490,13 +478,14 @@ class ReportB(ReportPort):
 
             wh_with_stock = 0
             if wh_rows:
+                inventories = self._inventory_reports([str(w.get('id') or w.get('lager_id')) for w in wh_rows])
                 for w in wh_rows:
                     wid = w.get('id') or w.get('lager_id')
                     wid_str = str(wid)
                     name = w.get('name') or w.get('lagername') or w.get('lager') or f"Lager {wid_str}"
-                    inv = self.inventory_report(wid_str)
-                    labels = [it.get('product_name') for it in inv if float(it.get('menge') or 0) > 0]
-                    values = [float(it.get('menge') or 0) for it in inv if float(it.get('menge') or 0) > 0]
+                    stocked = [(label, qty) for label, qty in ((it.get('product_name'), float(it.get('menge') or 0)) for it in inventories[wid_str]) if qty > 0]
+                    labels = [label for label, _ in stocked]
+                    values = [qty for _, qty in stocked]
                     if values:
                         wh_with_stock += 1
                     create_pie_chart(pdf, labels, values, f"Produktverteilung {name}")
@@ -521,13 +510,18 @@ class ReportB(ReportPort):
 
         return {"output": str(output_path), "summary": {"total_filtered": len(table_rows), "top_count": len(top_movements), "bottom_count": len(bottom_movements)}, "generated": datetime.now().isoformat()}
 
-    def inventory_report(self, lager_id: str) -> List[Dict]:
+    def _inventory_reports(self, lager_ids: List[str]) -> Dict[str, List[Dict]]:
         try:
+            if getattr(self, 'report_a', None) and getattr(self.report_a, 'inventory_reports', None):
+                return self.report_a.inventory_reports(lager_ids)
             if getattr(self, 'report_a', None) and getattr(self.report_a, 'inventory_report', None):
-                return self.report_a.inventory_report(lager_id)
+                return {lid: self.report_a.inventory_report(lid) for lid in lager_ids}
         except Exception:
             pass
+        return self._fallback_inventory_reports(lager_ids)
 
+    def _fallback_inventory_reports(self, lager_ids: List[str]) -> Dict[str, List[Dict]]:
+        """Build the inventories of several warehouses from one history scan and one product fetch."""
         try:
             rows = self.db.find_all('history') if getattr(self, 'db', None) else []
         except Exception:
@@ -535,11 +529,27 @@ class ReportB(ReportPort):
 
         parsed = [_parse_history_row(r) for r in rows]
 
-        parsed.sort(key=lambda x: _to_dt(x.get('timestamp')))
+        parsed.sort(key=lambda x: _to_epoch(x.get('timestamp')))
         filtered = [p for p in parsed if _is_relevant(p)]
 
+        totals = {str(lid): self._inventory_totals(str(lid), filtered) for lid in lager_ids}
+
+        product_names: Dict[str, str] = {}
+        product_ids = {pid for inv in totals.values() for pid in inv}
+        try:
+            if product_ids and getattr(self, 'db', None) and getattr(self.db, 'find_many_by_ids', None):
+                rows = self.db.find_many_by_ids('products', list(product_ids))
+                product_names = {str(r.get('id')): r.get('name') for r in rows or [] if r.get('id') is not None and r.get('name')}
+        except Exception:
+            pass
+
+        return {
+            lid: [{'product_id': str(pid), 'product_name': product_names.get(str(pid)) or f'Produkt {pid}', 'menge': amt} for pid, amt in inv.items()]
+            for lid, inv in totals.items()
+        }
+
+    def _inventory_totals(self, lid_str: str, filtered: List[Dict]) -> Dict[str, float]:
         inv: Dict[str, float] = {}
-        lid_str = str(lager_id)
         for p in filtered:
             pid = p.get('product_id')
             if not pid:
@@ -571,25 +581,16 @@ class ReportB(ReportPort):
                         break
             except Exception:
                 pass
+        return inv
 
-        product_names: Dict[str, str] = {}
+    def inventory_report(self, lager_id: str) -> List[Dict]:
         try:
-            if getattr(self, 'db', None) and getattr(self.db, 'find_many_by_ids', None):
-                rows = self.db.find_many_by_ids('products', list(inv.keys()))
-                for r in rows or []:
-                    pid = r.get('id')
-                    if pid is None:
-                        continue
-                    name = r.get('name')
-                    if name:
-                        product_names[str(pid)] = name
+            if getattr(self, 'report_a', None) and getattr(self.report_a, 'inventory_report', None):
+                return self.report_a.inventory_report(lager_id)
         except Exception:
             pass
 
-        out: List[Dict] = []
-        for pid, amt in inv.items():
-            out.append({'product_id': str(pid), 'product_name': product_names.get(str(pid)) or f'Produkt {pid}', 'menge': amt})
-        return out
+        return self._fallback_inventory_reports([lager_id])[str(lager_id)]
 
     def statistics_report(self) -> Dict:
         try:
@@ -599,29 +600,20 @@ class ReportB(ReportPort):
             pass
 
         stats = {'total_products': 0, 'total_warehouses': 0, 'total_stock_units': 0}
+        whs: List[Dict] = []
         try:
             if getattr(self, 'db', None):
-                prods = self.db.find_all('products') or []
                 whs = self.db.find_all('warehouses') or []
-                stats['total_products'] = len(prods)
+                stats['total_products'] = self.db.count('products')
                 stats['total_warehouses'] = len(whs)
         except Exception:
             pass
 
         try:
             total = 0.0
-            wh_ids = []
-            try:
-                whs = self.db.find_all('warehouses') or []
-                for w in whs:
-                    wid = w.get('id') or w.get('lager_id')
-                    if wid is not None:
-                        wh_ids.append(str(wid))
-            except Exception:
-                wh_ids = []
+            wh_ids = [str(wid) for wid in (w.get('id') or w.get('lager_id') for w in whs) if wid is not None]
 
-            for wid in wh_ids:
-                inv = self.inventory_report(wid)
+            for inv in self._inventory_reports(wh_ids).values():
                 for item in inv:
                     try:
                         total += float(item.get('menge') or 0)
@@ -1,12 +1,30 @@
 from typing import List, Dict, Optional
+from functools import lru_cache
 from matplotlib import pyplot as plt
 from matplotlib.patches import Rectangle
 from matplotlib.backends.backend_pdf import PdfPages
-from datetime import datetime
 from PIL import Image
 from pathlib import Path
 
 
+A4_FIGSIZE = (8.27, 11.69)
+
+_MODULE_FILE = Path(__file__).resolve()
+_LOGO_DIRS = [
+    _MODULE_FILE.parents[1] / "resources" / "pictures",
+    _MODULE_FILE.parents[2] / "src" / "resources" / "pictures",
+    _MODULE_FILE.parents[2] / "resources" / "pictures",
+]
+_LOGO_NAMES = [
+    "BIER_LOGO_WEISS_COMPRESSED.png",
+    "BIER_LOGO_SCHWARZ_COMPRESSED.png",
+    "BIER_ICON_COMPRESSED.png",
+]
+
+# Left-aligned, padded and truncated to 30 characters, like `str(cell)[:30].ljust(30)`.
+_CELL_FMT = "{:<30.30}".format
+
+
 def _add_page_border(fig, color: str = "black", linewidth: float = 1.2, margin: float = 0.04):
     try:
         rect = Rectangle((margin, margin), 1 - 2 * margin, 1 - 2 * margin, fill=False, edgecolor=color, linewidth=linewidth)
@@ -16,36 +34,29 @@ def _add_page_border(fig, color: str = "black", linewidth: float = 1.2, margin:
         pass
 
 
+@lru_cache(maxsize=None)
+def _find_logo_path() -> Optional[Path]:
+    """Return the first existing cover logo; the lookup runs once per process."""
+    for d in _LOGO_DIRS:
+        try:
+            for name in _LOGO_NAMES:
+                p = d / name
+                if p.exists():
+                    return p
+        except Exception:
+            continue
+    return None
+
+
 def create_cover_page(pdf: PdfPages, title: str, subtitle: str, meta: Optional[Dict[str, str]] = None) -> None:
-    fig = plt.figure(figsize=(8.27, 11.69))
+    fig = plt.figure(figsize=A4_FIGSIZE)
     fig.patch.set_facecolor("#f7f7f7")
 
     _add_page_border(fig, color="#000000", linewidth=1.2, margin=0.04)
 
     title_y = 0.78
     try:
-        candidates = [
-            Path(__file__).resolve().parents[1] / "resources" / "pictures",
-            Path(__file__).resolve().parents[2] / "src" / "resources" / "pictures",
-            Path(__file__).resolve().parents[2] / "resources" / "pictures",
-        ]
-        logo_candidates = [
-            "BIER_LOGO_WEISS_COMPRESSED.png",
-            "BIER_LOGO_SCHWARZ_COMPRESSED.png",
-            "BIER_ICON_COMPRESSED.png",
-        ]
-        logo_path = None
-        for d in candidates:
-            try:
-                for name in logo_candidates:
-                    p = d / name
-                    if p.exists():
-                        logo_path = p
-                        break
-            except Exception:
-                continue
-            if logo_path:
-                break
+        logo_path = _find_logo_path()
         if logo_path:
             img = Image.open(logo_path)
             img_w, img_h = img.size
@@ -77,6 +88,19 @@ def create_cover_page(pdf: PdfPages, title: str, subtitle: str, meta: Optional[D
     plt.close(fig)
 
 
+def _column_widths(ncols: int) -> List[float]:
+    if ncols < 3:
+        return [1.0 / ncols] * ncols if ncols else []
+    if ncols == 5:
+        return [0.18, 0.44, 0.12, 0.13, 0.13]
+    if ncols == 6:
+        return [0.14, 0.34, 0.20, 0.10, 0.11, 0.11]
+    first = 0.14
+    second = 0.34
+    rest = max(0.03, (1.0 - first - second) / max(1, ncols - 2))
+    return [first, second] + [rest] * (ncols - 2)
+
+
 def create_table_pages(pdf: PdfPages, headers: List[str], rows: List[List[str]], title: Optional[str] = None, rows_per_page: int = 40, fit_one_page: bool = False) -> None:
     """Render table rows into one or more A4 pages.
 
@@ -89,38 +113,27 @@ def create_table_pages(pdf: PdfPages, headers: List[str], rows: List[List[str]],
     margin = 0.06
     # keep table drawing area large; draw a thinner frame instead of shrinking the table
     frame_margin = 0.02
+
+    # column layout, font size and text header depend only on the headers, not on the page
+    ncols = len(headers)
+    col_widths = _column_widths(ncols)
+    font_size = 9 if ncols <= 4 else (8 if ncols == 5 else 7)
+    header_line = "  ".join([h.ljust(30) for h in headers])
     for page in range(total_pages):
         start = page * rows_per_page
         end = start + rows_per_page
         page_rows = rows[start:end]
 
-        fig, ax = plt.subplots(figsize=(8.27, 11.69))
+        fig, ax = plt.subplots(figsize=A4_FIGSIZE)
         _add_page_border(fig, margin=frame_margin)
         ax.axis("off")
         if title:
             ax.set_title(title, fontsize=12, loc="left")
         try:
             cell_text = [[str(c) for c in r] for r in page_rows]
-            ncols = len(headers)
-
-            if ncols >= 3:
-                if ncols == 5:
-                    col_widths = [0.18, 0.44, 0.12, 0.13, 0.13]
-                elif ncols == 6:
-                    col_widths = [0.14, 0.34, 0.20, 0.10, 0.11, 0.11]
-                else:
-                    first = 0.14
-                    second = 0.34
-                    rest = max(0.03, (1.0 - first - second) / max(1, ncols - 2))
-                    col_widths = [first, second] + [rest] * (ncols - 2)
-            else:
-                col_widths = [1.0 / ncols] * ncols
 
             table = ax.table(cellText=cell_text, colLabels=headers, loc="center", cellLoc="left", colWidths=col_widths, bbox=[0.0, 0.02, 1.0, 0.96])
             table.auto_set_font_size(False)
-
-            # choose a sensible font size depending on column count
-            font_size = 9 if ncols <= 4 else (8 if ncols == 5 else 7)
             table.set_fontsize(font_size)
 
             # scale the table conservatively so it fits A4; reduce vertical scale if many rows
@@ -131,11 +144,10 @@ def create_table_pages(pdf: PdfPages, headers: List[str], rows: List[List[str]],
         except Exception:
 
             y = 0.92
-            header_line = "  ".join([h.ljust(30) for h in headers])
             ax.text(0.05, y, header_line, fontfamily="monospace", fontsize=9)
             y -= 0.03
             for r in page_rows:
-                line = "  ".join([str(c)[:30].ljust(30) for c in r])
+                line = "  ".join(map(_CELL_FMT, map(str, r)))
                 ax.text(0.05, y, line, fontfamily="monospace", fontsize=8)
                 y -= 0.025
                 if y < 0.05:
@@ -153,7 +165,7 @@ def create_table_pages(pdf: PdfPages, headers: List[str], rows: List[List[str]],
 def create_bar_chart(pdf: PdfPages, names: List[str], values: List[float], title: str) -> None:
     # If no data present, render a clear placeholder page instead of an empty chart.
     if not names or not values or all((v == 0 or v is None) for v in values):
-        fig = plt.figure(figsize=(8.27, 11.69))
+        fig = plt.figure(figsize=A4_FIGSIZE)
         plt.axis("off")
         _add_page_border(fig)
         fig.suptitle(title, fontsize=14, weight="bold", y=0.9)
@@ -163,7 +175,7 @@ def create_bar_chart(pdf: PdfPages, names: List[str], values: List[float], title
         plt.close(fig)
         return
 
-    fig = plt.figure(figsize=(8.27, 11.69))
+    fig = plt.figure(figsize=A4_FIGSIZE)
     _add_page_border(fig)
     fig.suptitle(title, fontsize=14, weight="bold", y=0.92)
     ax = fig.add_axes([0.12, 0.32, 0.76, 0.55])
@@ -179,7 +191,7 @@ def create_bar_chart(pdf: PdfPages, names: List[str], values: List[float], title
 def create_pie_chart(pdf: PdfPages, labels: List[str], values: List[float], title: str) -> None:
     # Render a placeholder when no meaningful data present
     if not labels or not values or all((v == 0 or v is None) for v in values):
-        fig = plt.figure(figsize=(8.27, 11.69))
+        fig = plt.figure(figsize=A4_FIGSIZE)
         plt.axis("off")
         _add_page_border(fig)
         fig.suptitle(title, fontsize=14, weight="bold", y=0.9)
@@ -189,7 +201,7 @@ def create_pie_chart(pdf: PdfPages, labels: List[str], values: List[float], titl
         plt.close(fig)
         return
 
-    fig = plt.figure(figsize=(8.27, 11.69))
+    fig = plt.figure(figsize=A4_FIGSIZE)
     _add_page_border(fig)
     fig.suptitle(title, fontsize=14, weight="bold", y=0.92)
     ax = fig.add_axes([0.18, 0.3, 0.64, 0.5])
@@ -201,7 +213,7 @@ def create_pie_chart(pdf: PdfPages, labels: List[str], values: List[float], titl
 
 
 def create_summary_page(pdf: PdfPages, summary: Dict[str, object]) -> None:
-    fig = plt.figure(figsize=(8.27, 11.69))
+    fig = plt.figure(figsize=A4_FIGSIZE)
     plt.axis("off")
     _add_page_border(fig)
     plt.text(0.1, 0.9, "Zusammenfassung", fontsize=16, weight="bold")
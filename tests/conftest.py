@@ -2,53 +2,164 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from copy import deepcopy
 from pathlib import Path
+import re
 import sys
 from typing import Any
 
 import pytest
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
+TEMPLATES_DIR = SRC_PATH / "resources" / "templates"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
 from bierapp.frontend.flask.gui import register_routes
 
 
+def pytest_addoption(parser):
+    parser.addoption("--run-live", action="store_true", default=False, help="run tests against live external services")
+
+
+def pytest_collection_modifyitems(config, items):
+    # A mark expression that mentions "live" (e.g. "-m 'live or unit'") counts as opting in.
+    # "-m 'not live'" also mentions it, but pytest deselects the live tests before they could run.
+    if config.getoption("--run-live") or re.search(r"\blive\b", config.getoption("markexpr") or ""):
+        return
+    skip_live = pytest.mark.skip(reason="needs --run-live")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
 class FakeDb:
     def __init__(self) -> None:
-        self.collections: dict[str, list[dict[str, Any]]] = {
-            "products": [],
-            "warehouses": [],
-            "inventory": [],
-            "history": [],
-        }
         self._next_id = 1
+        # Rows are keyed by str(id); dicts keep insertion order, which stands in for ORDER BY id.
+        self.tables: dict[str, dict[str, dict[str, Any]]] = {
+            "products": {},
+            "warehouses": {},
+            "inventory": {},
+            "history": {},
+        }
+        # Secondary index: inventory rows per lager_id, kept in step by insert/update/delete.
+        self._inventory_by_lager: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+
+    def reset(self) -> None:
+        # Emptied in place so the session-wide instance is reused by every test.
+        # IDs keep counting like a database sequence, so cached data never matches a fresh test.
+        for rows in self.tables.values():
+            rows.clear()
+        self._inventory_by_lager.clear()
+
+    @property
+    def collections(self) -> dict[str, list[dict[str, Any]]]:
+        return {name: list(rows.values()) for name, rows in self.tables.items()}
+
+    # The stored row itself, not a copy: the fake services edit rows in place.
+    def row(self, collection: str, document_id: Any) -> dict[str, Any] | None:
+        return self.tables.get(collection, {}).get(str(document_id))
+
+    def inventory_of(self, lager_id: Any):
+        return self._inventory_by_lager.get(str(lager_id), {}).values()
+
+    def _index(self, collection: str, row: dict[str, Any]) -> None:
+        if collection == "inventory":
+            self._inventory_by_lager[str(row["lager_id"])][str(row["id"])] = row
+
+    def _unindex(self, collection: str, row: dict[str, Any]) -> None:
+        if collection == "inventory":
+            self._inventory_by_lager[str(row["lager_id"])].pop(str(row["id"]), None)
 
     def insert(self, collection: str, data: dict[str, Any]) -> int:
         row = deepcopy(data)
         if "id" not in row:
             row["id"] = self._next_id
             self._next_id += 1
-        self.collections.setdefault(collection, []).append(row)
+        self.tables.setdefault(collection, {})[str(row["id"])] = row
+        self._index(collection, row)
         return int(row["id"])
 
+    # Reads hand out shallow row copies, enough to stop callers adding or replacing keys on
+    # stored rows; nested values are shared and must be treated as read-only.
+    def find_by_id(self, collection: str, document_id: str) -> dict[str, Any] | None:
+        item = self.row(collection, document_id)
+        return dict(item) if item else None
+
+    def find_fields_by_id(self, collection: str, document_id: str, fields: list[str]) -> dict[str, Any] | None:
+        item = self.row(collection, document_id)
+        return {field: item.get(field) for field in fields} if item else None
+
     def find_all(self, collection: str) -> list[dict[str, Any]]:
-        return [deepcopy(item) for item in self.collections.get(collection, [])]
+        return list(map(dict, self.tables.get(collection, {}).values()))
+
+    def find_many_by_ids(self, collection: str, document_ids: list[str]) -> list[dict[str, Any]]:
+        rows = self.tables.get(collection, {})
+        return [dict(rows[key]) for key in dict.fromkeys(map(str, document_ids)) if key in rows]
+
+    def find_page(self, collection: str, limit: int, offset: int = 0) -> list[dict[str, Any]]:
+        return sorted(self.find_all(collection), key=lambda item: int(item["id"]))[offset:offset + limit]
+
+    def find_where(self, collection: str, criteria: dict[str, Any]) -> list[dict[str, Any]]:
+        if collection == "inventory" and "lager_id" in criteria:
+            candidates = self.inventory_of(criteria["lager_id"])
+        else:
+            candidates = self.tables.get(collection, {}).values()
+        return [dict(item) for item in candidates if all(item.get(key) == value for key, value in criteria.items())]
+
+    def update(self, collection: str, document_id: str, data: dict[str, Any]) -> bool:
+        item = self.row(collection, document_id)
+        if item is None:
+            return False
+        self._unindex(collection, item)
+        item.update(deepcopy(data))
+        self._index(collection, item)
+        return True
+
+    def delete(self, collection: str, document_id: str) -> bool:
+        item = self.tables.get(collection, {}).pop(str(document_id), None)
+        if item is None:
+            return False
+        self._unindex(collection, item)
+        return True
+
+    def aggregate_inventory_stats(self) -> dict[str, dict[str, int]]:
+        warehouse_ids = self.tables["warehouses"]
+        totals: dict[str, dict[str, int]] = {"warehouses": {}, "products": {}}
+        for item in self.tables["inventory"].values():
+            lager_id = str(item["lager_id"])
+            if lager_id not in warehouse_ids:
+                continue
+            produkt_id = str(item["produkt_id"])
+            totals["warehouses"][lager_id] = totals["warehouses"].get(lager_id, 0) + int(item["menge"])
+            totals["products"][produkt_id] = totals["products"].get(produkt_id, 0) + int(item["menge"])
+        return totals
+
+    def aggregate_statistics(self) -> dict[str, int]:
+        return {
+            "total_products": len(self.tables["products"]),
+            "total_warehouses": len(self.tables["warehouses"]),
+            "total_stock_units": sum(int(item["menge"]) for item in self.tables["inventory"].values()),
+        }
+
+    def count(self, collection: str) -> int:
+        return len(self.tables.get(collection, {}))
 
 
 class FakeProductService:
     def __init__(self, db: FakeDb) -> None:
         self.db = db
 
-    def list_products(self):
-        return self.db.find_all("products")
+    def list_products(self, limit: int | None = None, offset: int = 0):
+        return self.db.find_all("products") if limit is None else self.db.find_page("products", limit, offset)
 
     def get_product(self, produkt_id: str):
-        return next((item for item in self.db.collections["products"] if str(item["id"]) == str(produkt_id)), None)
+        return self.db.row("products", produkt_id)
 
     def create_product(self, name: str, beschreibung: str, gewicht: float, preis: float = 0.0, waehrung: str = "EUR", lieferant: str = "", einheit: str = "Stk", attributes=None):
         if gewicht <= 0:
@@ -76,9 +187,7 @@ class FakeProductService:
         return deepcopy(product)
 
     def delete_product(self, produkt_id: str):
-        before = len(self.db.collections["products"])
-        self.db.collections["products"] = [item for item in self.db.collections["products"] if str(item["id"]) != str(produkt_id)]
-        if len(self.db.collections["products"]) == before:
+        if not self.db.delete("products", produkt_id):
             raise KeyError("Product not found")
 
 
@@ -87,8 +196,8 @@ class FakeInventoryService:
         self.db = db
 
     def _find(self, lager_id: int, produkt_id: int):
-        for item in self.db.collections["inventory"]:
-            if int(item["lager_id"]) == int(lager_id) and int(item["produkt_id"]) == int(produkt_id):
+        for item in self.db.inventory_of(lager_id):
+            if int(item["produkt_id"]) == int(produkt_id):
                 return item
         return None
 
@@ -114,17 +223,13 @@ class FakeInventoryService:
             existing["menge"] = int(menge)
 
     def remove_product(self, lager_id: int, produkt_id: int):
-        before = len(self.db.collections["inventory"])
-        self.db.collections["inventory"] = [
-            item
-            for item in self.db.collections["inventory"]
-            if not (int(item["lager_id"]) == int(lager_id) and int(item["produkt_id"]) == int(produkt_id))
-        ]
-        if len(self.db.collections["inventory"]) == before:
+        existing = self._find(lager_id, produkt_id)
+        if existing is None:
             raise KeyError("Inventory entry not found")
+        self.db.delete("inventory", existing["id"])
 
     def list_inventory(self, lager_id: int):
-        return [item for item in self.db.find_all("inventory") if int(item["lager_id"]) == int(lager_id)]
+        return list(map(dict, self.db.inventory_of(lager_id)))
 
 
 class FakeWarehouseService:
@@ -136,7 +241,7 @@ class FakeWarehouseService:
         return self.db.find_all("warehouses")
 
     def get_warehouse(self, warehouse_id: str):
-        return next((item for item in self.db.collections["warehouses"] if str(item["id"]) == str(warehouse_id)), None)
+        return self.db.row("warehouses", warehouse_id)
 
     def create_warehouse(self, lagername: str, adresse: str, max_plaetze: int, firma_id: int):
         row = {
@@ -156,17 +261,27 @@ class FakeWarehouseService:
         return deepcopy(warehouse)
 
     def delete_warehouse(self, lager_id: str):
-        before = len(self.db.collections["warehouses"])
-        self.db.collections["warehouses"] = [item for item in self.db.collections["warehouses"] if str(item["id"]) != str(lager_id)]
-        if len(self.db.collections["warehouses"]) == before:
+        if not self.db.delete("warehouses", lager_id):
             raise KeyError("Warehouse not found")
 
     def add_product_to_warehouse(self, lager_id: int, produkt_id: int, menge: int):
         self.inventory_service.add_product(int(lager_id), int(produkt_id), int(menge))
 
 
-@pytest.fixture
-def services():
+@pytest.fixture(scope="session")
+def seeded_db():
+    def _seed(**collections: list[dict[str, Any]]) -> FakeDb:
+        db = FakeDb()
+        for name, rows in collections.items():
+            for row in rows:
+                db.insert(name, row)
+        return db
+
+    return _seed
+
+
+@pytest.fixture(scope="session")
+def _session_services():
     db = FakeDb()
     product_service = FakeProductService(db)
     inventory_service = FakeInventoryService(db)
@@ -180,14 +295,37 @@ def services():
 
 
 @pytest.fixture
-def app_factory(services):
-    app = Flask(__name__, template_folder="src/resources/templates")
-    app.config["TESTING"] = True
-    register_routes(app, services["products"], services["warehouses"], services["inventory"])
+def services(_session_services):
+    _session_services["db"].reset()
+    return _session_services
+
+
+@pytest.fixture(scope="session")
+def _session_app(_session_services, pytestconfig):
+    app = Flask(__name__, template_folder=str(TEMPLATES_DIR))
+    # PROPAGATE_EXCEPTIONS lets a failing route raise into the test with its full traceback.
+    app.config.update(TESTING=True, DEBUG=False, PROPAGATE_EXCEPTIONS=True, TEMPLATES_AUTO_RELOAD=False)
+    # Templates never change during a run, so Jinja can skip the per-render stat() of the source files.
+    app.jinja_env.auto_reload = False
+    # Compiled templates survive between runs (and xdist workers) in .pytest_cache.
+    if getattr(pytestconfig, "cache", None) is not None:
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(pytestconfig.cache.mkdir("jinja")))
+    register_routes(app, _session_services["products"], _session_services["warehouses"], _session_services["inventory"])
     return app
 
 
 @pytest.fixture
-def client(app_factory):
-    return app_factory.test_client()
+def app_factory(_session_app, services):
+    return _session_app
+
+
+@pytest.fixture(scope="session")
+def _session_client(_session_app):
+    # The app sets no cookies, so one test client can serve every test.
+    return _session_app.test_client()
+
+
+@pytest.fixture
+def client(_session_client, services):
+    return _session_client
 
@@ -1,15 +1,34 @@
-import urllib.error
-import urllib.request
+import re
 
 import pytest
 
 
-def test_flask_reachable():
-    """Checks that the externally running Flask server answers on port 5000."""
-    try:
-        with urllib.request.urlopen("http://localhost:5000", timeout=5) as response:
-            body = response.read().decode("utf-8", errors="ignore")
-            assert response.status == 200
-            assert "<html" in body.lower() or "<!doctype html" in body.lower()
-    except urllib.error.URLError as exc:
-        pytest.skip(f"Flask server not reachable on localhost:5000: {exc}")
+PAGES = [
+    ("/", "Produktverwaltung"),
+    ("/page1", "Produktbearbeitung"),
+    ("/page2", "Lagerliste"),
+    ("/page3", "Statistik"),
+    ("/page4", "Historie"),
+    ("/page5", "Lager bearbeiten"),
+    ("/page6", "Reports"),
+]
+
+_CHART_IDS = (b"chartWarehouses", b"chartUtilization", b"chartDistribution", b"chartCurrencyValue")
+_CHART_ID_RE = re.compile(b"|".join(_CHART_IDS))
+
+
+@pytest.mark.parametrize("route,title", PAGES)
+def test_page_renders(client, route, title):
+    """Checks that every page of the Flask app renders in-process."""
+    response = client.get(route)
+
+    assert response.status_code == 200
+    assert f"<title>B.I.E.R – {title}</title>".encode() in response.data
+
+
+def test_statistics_page_contains_charts(client):
+    """Checks that the statistics page renders every chart container (one scan over the page)."""
+    response = client.get("/page3")
+
+    assert response.status_code == 200
+    assert set(_CHART_ID_RE.findall(response.data)) == set(_CHART_IDS)
@@ -1,3 +1,8 @@
+import re
+
+import pytest
+
+
 def test_create_product_and_get_by_id(client):
 	create_response = client.post(
 		"/products",
@@ -14,11 +19,21 @@ def test_create_product_and_get_by_id(client):
 	assert get_response.get_json()["id"] == created["id"]
 
 
-def test_create_product_rejects_missing_required_fields(client):
-	response = client.post("/products", json={"beschreibung": "Oops"})
+@pytest.mark.parametrize(
+	("endpoint", "payload", "collection", "error"),
+	[
+		("/products", {"beschreibung": "Oops"}, "products", "Missing required fields: name, gewicht"),
+		("/products", {"name": "X", "gewicht": "schwer"}, "products", "Invalid data type"),
+		("/warehouses", {"lagername": "X", "adresse": "Y"}, "warehouses", "Missing required fields: lagername, adresse, max_plaetze"),
+		("/warehouses", {"lagername": "X", "adresse": "Y", "max_plaetze": "kein-int"}, "warehouses", "Invalid data type"),
+	],
+)
+def test_invalid_create_is_rejected_without_insert(client, services, endpoint, payload, collection, error):
+	response = client.post(endpoint, json=payload)
 
 	assert response.status_code == 400
-	assert "Missing required fields" in response.get_json()["error"]
+	assert response.get_json()["error"] == error
+	assert services["db"].collections[collection] == []
 
 
 def test_update_unknown_product_returns_404(client):
@@ -63,16 +78,6 @@ def test_create_warehouse_and_list_contains_products_count(client):
 	assert warehouses[0]["products"] == 7
 
 
-def test_create_warehouse_rejects_invalid_payload(client):
-	response = client.post(
-		"/warehouses",
-		json={"lagername": "X", "adresse": "Y", "max_plaetze": "kein-int"},
-	)
-
-	assert response.status_code == 400
-	assert response.get_json()["error"] == "Invalid data type"
-
-
 def test_set_inventory_to_zero_removes_item(client):
 	warehouse = client.post(
 		"/warehouses",
@@ -100,17 +105,16 @@ def test_set_inventory_to_zero_removes_item(client):
 	assert inventory_response.get_json() == []
 
 
-def test_move_inventory_returns_error_when_source_equals_target(client):
-	response = client.post(
-		"/inventory/move",
-		json={"source_lager_id": 1, "target_lager_id": 1, "produkt_id": 5, "menge": 1},
-	)
-
-	assert response.status_code == 400
-	assert response.get_json()["error"] == "Source and target warehouse must be different"
-
-
-def test_move_inventory_returns_error_when_stock_is_insufficient(client):
+@pytest.mark.parametrize(
+	("same_warehouse", "menge", "error"),
+	[
+		(True, 1, "Source and target warehouse must be different"),
+		(False, 0, "menge must be a positive integer"),
+		(False, -5, "menge must be a positive integer"),
+		(False, 5, "Not enough stock in source warehouse"),
+	],
+)
+def test_invalid_move_is_rejected_without_changing_stock(client, services, same_warehouse, menge, error):
 	source = client.post(
 		"/warehouses",
 		json={"lagername": "Q1", "adresse": "A", "max_plaetze": 10},
@@ -133,13 +137,15 @@ def test_move_inventory_returns_error_when_stock_is_insufficient(client):
 		"/inventory/move",
 		json={
 			"source_lager_id": int(source["id"]),
-			"target_lager_id": int(target["id"]),
+			"target_lager_id": int(source["id"] if same_warehouse else target["id"]),
 			"produkt_id": int(product["id"]),
-			"menge": 5,
+			"menge": menge,
 		},
 	)
 	assert move_response.status_code == 400
-	assert move_response.get_json()["error"] == "Not enough stock in source warehouse"
+	assert move_response.get_json()["error"] == error
+	inventory = services["db"].collections["inventory"]
+	assert [(row["lager_id"], row["menge"]) for row in inventory] == [(int(source["id"]), 2)]
 
 
 def test_move_inventory_successfully_updates_both_warehouses(client):
@@ -178,3 +184,90 @@ def test_move_inventory_successfully_updates_both_warehouses(client):
 	payload = move_response.get_json()
 	assert payload["source_qty"] == 5
 	assert payload["target_qty"] == 4
+
+
+def test_report_pdf_is_rendered_on_every_request(client, monkeypatch):
+	from reports.report_a import ReportA
+
+	calls = []
+	generate_report = ReportA.generate_report
+	monkeypatch.setattr(ReportA, "generate_report", lambda self, output_path: calls.append(1) or generate_report(self, output_path))
+	client.post("/products", json={"name": "Pils", "beschreibung": "Hell", "gewicht": 0.5})
+
+	first = client.get("/reports/a/download")
+	assert first.status_code == 200
+	assert first.mimetype == "application/pdf"
+	assert first.data.startswith(b"%PDF")
+
+	second = client.get("/reports/a/preview")
+	assert second.status_code == 200
+	assert second.data.startswith(b"%PDF")
+	assert len(calls) == 2
+
+
+def test_delete_warehouse_logs_name_and_address(client):
+	created = client.post(
+		"/warehouses",
+		json={"lagername": "Nord", "adresse": "Weg 1", "max_plaetze": 5, "firma_id": 1},
+	).get_json()
+
+	response = client.delete(f"/warehouses/{created['id']}")
+
+	assert response.status_code == 204
+	details = [row["details"] for row in client.get("/history").get_json()]
+	assert f"Lager {created['id']}: Nord (Weg 1)" in details
+
+
+def test_list_products_returns_requested_page(client):
+	for name in ("Pils", "Weizen", "Bock"):
+		client.post("/products", json={"name": name, "beschreibung": "-", "gewicht": 0.5})
+
+	page = client.get("/products?limit=2&offset=1").get_json()
+
+	assert [product["name"] for product in page] == ["Weizen", "Bock"]
+	assert client.get("/products?limit=-1").status_code == 400
+
+
+def test_get_inventory_returns_rows_of_all_warehouses(client):
+	first = client.post("/warehouses", json={"lagername": "W1", "adresse": "A", "max_plaetze": 10}).get_json()
+	second = client.post("/warehouses", json={"lagername": "W2", "adresse": "B", "max_plaetze": 10}).get_json()
+	product = client.post("/products", json={"name": "Bock", "gewicht": 1.0}).get_json()
+	for warehouse, menge in ((first, 3), (second, 4)):
+		client.put("/inventory", json={"lager_id": int(warehouse["id"]), "produkt_id": int(product["id"]), "menge": menge})
+
+	response = client.get("/inventory")
+
+	assert response.status_code == 200
+	rows = sorted((row["lager_id"], row["menge"]) for row in response.get_json())
+	assert rows == [(int(first["id"]), 3), (int(second["id"]), 4)]
+
+
+def test_statistics_page_aggregates_seeded_inventory(client):
+	first = client.post("/warehouses", json={"lagername": "W1", "adresse": "A", "max_plaetze": 20}).get_json()
+	second = client.post("/warehouses", json={"lagername": "W2", "adresse": "B", "max_plaetze": 10}).get_json()
+	client.post("/warehouses", json={"lagername": "Leer", "adresse": "C", "max_plaetze": 5})
+	pils = client.post(
+		"/products",
+		json={"name": "Pils", "gewicht": 0.5, "preis": 2.5, "waehrung": "EUR", "lieferant": "Brauerei A"},
+	).get_json()
+	stout = client.post(
+		"/products",
+		json={"name": "Stout", "gewicht": 0.5, "preis": 4.0, "waehrung": "USD", "lieferant": "Brauerei B"},
+	).get_json()
+	weizen = client.post(
+		"/products",
+		json={"name": "Weizen", "gewicht": 0.5, "preis": 3.0, "waehrung": "EUR", "lieferant": "Brauerei A"},
+	).get_json()
+	for warehouse, product, menge in ((first, pils, 6), (first, stout, 2), (second, weizen, 4), (second, pils, 1)):
+		client.put("/inventory", json={"lager_id": int(warehouse["id"]), "produkt_id": int(product["id"]), "menge": menge})
+
+	response = client.get("/page3")
+
+	assert response.status_code == 200
+	html = response.get_data(as_text=True)
+	kpis = dict(re.findall(r'id="(kpi\w+)">([^<]*)<', html))
+	assert kpis == {"kpiWarehouses": "3", "kpiProducts": "13", "kpiCapacity": "35", "kpiFreeCapacity": "22"}
+	# EUR: 7 x 2.50 Pils + 4 x 3.00 Weizen, USD: 2 x 4.00 Stout
+	assert re.findall(r'<div class="bar-value">([\d.]+ (?:EUR|USD))</div>', html) == ["29.50 EUR", "8.00 USD"]
+	suppliers = re.findall(r'<strong>(Brauerei \w)</strong>\s*<span class="pill">(\d+) Stück</span>', html)
+	assert suppliers == [("Brauerei A", "11"), ("Brauerei B", "2")]
@@ -1,43 +1,15 @@
-from pathlib import Path
-import sys
+from datetime import datetime, timezone
 
-
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-SRC_PATH = PROJECT_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
+import pytest
 
 from reports.report_a import ReportA
 from reports.report_b import ReportB
 
 
-class FakeDb:
-    def __init__(self, history=None, products=None, warehouses=None):
-        self._history = history or []
-        self._products = products or []
-        self._warehouses = warehouses or []
-
-    def connect(self):
-        return None
-
-    def find_all(self, collection):
-        if collection == "history":
-            return list(self._history)
-        if collection == "products":
-            return list(self._products)
-        if collection == "warehouses":
-            return list(self._warehouses)
-        return []
-
-    def find_many_by_ids(self, collection, ids):
-        ids_set = {str(i) for i in ids}
-        if collection == "products":
-            return [p for p in self._products if str(p.get("id")) in ids_set]
-        return []
-
-
-def test_report_a_inventory_report_handles_inbound_and_outbound_movements():
-    db = FakeDb(
+# Pils: 5 assigned to warehouse 1, then 2 booked over to warehouse 2.
+@pytest.fixture(scope="module")
+def pils_db(seeded_db):
+    return seeded_db(
         history=[
             {
                 "entry_type": "inventory",
@@ -56,7 +28,32 @@ def test_report_a_inventory_report_handles_inbound_and_outbound_movements():
         warehouses=[{"id": "1", "lagername": "A"}, {"id": "2", "lagername": "B"}],
     )
 
-    report = ReportA(db)
+
+# Weizen: 8 assigned to warehouse 3, then 3 booked over to warehouse 4.
+@pytest.fixture(scope="module")
+def weizen_db(seeded_db):
+    return seeded_db(
+        history=[
+            {
+                "entry_type": "inventory",
+                "action": "assign",
+                "details": "produkt_id=7 lager_id=3 menge=8",
+                "created_at": "2026-01-01T10:00:00",
+            },
+            {
+                "entry_type": "inventory",
+                "action": "book",
+                "details": "produkt_id=7 source_lager=3 target_lager=4 menge=3",
+                "created_at": "2026-01-01T12:00:00",
+            },
+        ],
+        products=[{"id": "7", "name": "Weizen"}],
+        warehouses=[{"id": "3", "lagername": "Nord"}, {"id": "4", "lagername": "Sued"}],
+    )
+
+
+def test_report_a_inventory_report_handles_inbound_and_outbound_movements(pils_db):
+    report = ReportA(pils_db)
 
     inventory = report.inventory_report("1")
 
@@ -66,8 +63,8 @@ def test_report_a_inventory_report_handles_inbound_and_outbound_movements():
     assert inventory[0]["menge"] == 3.0
 
 
-def test_report_a_statistics_report_aggregates_over_warehouses():
-    db = FakeDb(
+def test_report_a_statistics_report_aggregates_over_warehouses(seeded_db):
+    db = seeded_db(
         history=[
             {
                 "entry_type": "inventory",
@@ -95,27 +92,48 @@ def test_report_a_statistics_report_aggregates_over_warehouses():
     assert stats["total_stock_units"] == 9.0
 
 
-def test_report_b_inventory_report_fallback_without_report_a():
-    db = FakeDb(
+def test_report_a_inventory_reports_scan_history_once(pils_db, monkeypatch):
+    report = ReportA(pils_db)
+    requested = []
+    find_all = pils_db.find_all
+    monkeypatch.setattr(pils_db, "find_all", lambda collection: requested.append(collection) or find_all(collection))
+
+    inventories = report.inventory_reports(["1", "2", "9"])
+
+    assert requested.count("history") == 1
+    assert inventories["9"] == []
+    assert inventories["1"][0]["menge"] == 3.0
+    assert inventories["2"][0]["menge"] == 2.0
+    assert inventories["2"][0]["product_name"] == "Pils"
+
+
+def test_report_a_sorts_mixed_naive_and_aware_timestamps(seeded_db):
+    db = seeded_db(
         history=[
             {
                 "entry_type": "inventory",
-                "action": "assign",
-                "details": "produkt_id=7 lager_id=3 menge=8",
-                "created_at": "2026-01-01T10:00:00",
+                "action": "book",
+                "details": "produkt_id=10 source_lager=1 target_lager=2 menge=2",
+                "created_at": datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
             },
             {
                 "entry_type": "inventory",
-                "action": "book",
-                "details": "produkt_id=7 source_lager=3 target_lager=4 menge=3",
-                "created_at": "2026-01-01T12:00:00",
+                "action": "assign",
+                "details": "produkt_id=10 lager_id=1 menge=5",
+                "created_at": "2026-01-01T10:00:00",
             },
         ],
-        products=[{"id": "7", "name": "Weizen"}],
-        warehouses=[{"id": "3", "lagername": "Nord"}, {"id": "4", "lagername": "Sued"}],
+        products=[{"id": "10", "name": "Pils"}],
+        warehouses=[{"id": "1", "lagername": "A"}, {"id": "2", "lagername": "B"}],
     )
 
-    report = ReportB(db)
+    inventory = ReportA(db).inventory_report("1")
+
+    assert inventory[0]["menge"] == 3.0
+
+
+def test_report_b_inventory_report_fallback_without_report_a(weizen_db):
+    report = ReportB(weizen_db)
     report.report_a = None
 
     inventory = report.inventory_report("3")
@@ -126,7 +144,23 @@ def test_report_b_inventory_report_fallback_without_report_a():
     assert inventory[0]["menge"] == 5.0
 
 
-def test_report_b_generate_report_returns_summary_on_empty_data(tmp_path, monkeypatch):
+def test_report_b_statistics_fallback_scans_history_once(weizen_db, monkeypatch):
+    report = ReportB(weizen_db)
+    report.report_a = None
+    requested = []
+    find_all = weizen_db.find_all
+    monkeypatch.setattr(weizen_db, "find_all", lambda collection: requested.append(collection) or find_all(collection))
+
+    stats = report.statistics_report()
+
+    assert requested.count("history") == 1
+    assert requested.count("warehouses") == 1
+    assert "products" not in requested
+    assert stats["total_warehouses"] == 2
+    assert stats["total_stock_units"] == 8.0
+
+
+def test_report_b_generate_report_returns_summary_on_empty_data(tmp_path, monkeypatch, seeded_db):
     class DummyPdf:
         def __init__(self, _):
             pass
@@ -137,7 +171,7 @@ def test_report_b_generate_report_returns_summary_on_empty_data(tmp_path, monkey
         def __exit__(self, exc_type, exc, tb):
             return False
 
-    db = FakeDb(history=[], products=[], warehouses=[])
+    db = seeded_db(history=[], products=[], warehouses=[])
     report = ReportB(db)
     report.report_a = type(
         "DummyReportA",
@@ -164,3 +198,71 @@ def test_report_b_generate_report_returns_summary_on_empty_data(tmp_path, monkey
     assert result["summary"]["total_filtered"] == 0
     assert result["summary"]["top_count"] == 0
     assert result["summary"]["bottom_count"] == 0
+
+
+def test_report_b_generate_report_batches_warehouse_inventories(tmp_path, monkeypatch, seeded_db):
+    db = seeded_db(
+        history=[
+            {
+                "entry_type": "inventory",
+                "action": "assign",
+                "details": "produkt_id=10 lager_id=1 menge=5",
+                "created_at": "2026-01-01T10:00:00",
+            },
+            {
+                "entry_type": "inventory",
+                "action": "assign",
+                "details": "produkt_id=20 lager_id=2 menge=4",
+                "created_at": "2026-01-01T11:00:00",
+            },
+        ],
+        products=[{"id": "10", "name": "Pils"}, {"id": "20", "name": "Stout"}],
+        warehouses=[{"id": "1", "lagername": "A"}, {"id": "2", "lagername": "B"}, {"id": "3", "lagername": "Leer"}],
+    )
+    report = ReportB(db)
+    batches = []
+    single_lookups = []
+    inventory_reports = report.report_a.inventory_reports
+    monkeypatch.setattr(
+        report.report_a,
+        "inventory_reports",
+        lambda lager_ids: batches.append(list(lager_ids)) or inventory_reports(lager_ids),
+    )
+    monkeypatch.setattr(report.report_a, "inventory_report", lambda lager_id: single_lookups.append(lager_id) or [])
+
+    output_path = tmp_path / "report_b.pdf"
+    report.generate_report(output_path)
+
+    assert output_path.read_bytes().startswith(b"%PDF")
+    assert batches == [["1", "2", "3"]]
+    assert single_lookups == []
+
+
+@pytest.mark.parametrize("size", [1, 40])
+def test_report_a_database_round_trips_do_not_grow_with_data(seeded_db, monkeypatch, size):
+    db = seeded_db(
+        history=[
+            {
+                "entry_type": "inventory",
+                "action": "assign",
+                "details": f"produkt_id={100 + i} lager_id={i} menge={i}",
+                "created_at": "2026-01-01T10:00:00",
+            }
+            for i in range(1, size + 1)
+        ],
+        products=[{"id": str(100 + i), "name": f"Bier {i}"} for i in range(1, size + 1)],
+        warehouses=[{"id": str(i), "lagername": f"Lager {i}"} for i in range(1, size + 1)],
+    )
+    calls = []
+
+    def recording(name, method):
+        return lambda collection, *args: calls.append((name, collection)) or method(collection, *args)
+
+    for name in ("find_all", "find_by_id", "find_many_by_ids", "find_where"):
+        monkeypatch.setattr(db, name, recording(name, getattr(db, name)))
+    report = ReportA(db)
+
+    inventories = report.inventory_reports([str(i) for i in range(1, size + 1)])
+
+    assert inventories[str(size)][0]["menge"] == float(size)
+    assert sorted(calls) == [("find_all", "history"), ("find_all", "warehouses"), ("find_many_by_ids", "products")]
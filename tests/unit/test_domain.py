@@ -2,24 +2,23 @@ import unittest
 from unittest.mock import MagicMock
 
 from bierapp.backend.service.product_service import InventoryService, ProductService
+from bierapp.contracts import DatabasePort, InventoryServicePort
 from bierapp.backend.service.warehouse_service import WarehouseService
 
 
 class TestProductService(unittest.TestCase):
-	def setUp(self):
-		self.db = MagicMock()
-		self.service = ProductService(self.db)
-
-	def test_create_product_rejects_non_positive_weight(self):
-		with self.assertRaises(ValueError):
-			self.service.create_product("Beer", "IPA", 0)
+	@classmethod
+	def setUpClass(cls):
+		cls.db = MagicMock(spec_set=DatabasePort)
+		cls.service = ProductService(cls.db)
 
-		with self.assertRaises(ValueError):
-			self.service.create_product("Beer", "IPA", -1)
+	def setUp(self):
+		self.db.reset_mock(return_value=True, side_effect=True)
 
-	def test_create_product_rejects_negative_price(self):
-		with self.assertRaises(ValueError):
-			self.service.create_product("Beer", "IPA", 1.0, preis=-0.01)
+	def test_create_product_rejects_invalid_weight_or_price(self):
+		for gewicht, preis in ((0, 0.0), (-1, 0.0), (1.0, -0.01)):
+			with self.subTest(gewicht=gewicht, preis=preis), self.assertRaises(ValueError):
+				self.service.create_product("Beer", "IPA", gewicht, preis=preis)
 
 	def test_create_product_applies_defaults_and_normalizes_attributes(self):
 		self.db.insert.return_value = "42"
@@ -82,11 +81,17 @@ class TestProductService(unittest.TestCase):
 		self.assertEqual(result[0]["attributes"], [{"name": "size", "value": "0.5l"}])
 		self.assertEqual(result[1]["attributes"], [])
 
-	def test_update_product_raises_if_missing(self):
+	def test_update_and_delete_product_raise_if_missing(self):
 		self.db.update.return_value = False
+		self.db.delete.return_value = False
+		calls = (
+			(self.service.update_product, ("999", {"name": "New"})),
+			(self.service.delete_product, ("404",)),
+		)
 
-		with self.assertRaises(KeyError):
-			self.service.update_product("999", {"name": "New"})
+		for method, args in calls:
+			with self.subTest(method=method.__name__), self.assertRaises(KeyError):
+				method(*args)
 
 	def test_update_product_normalizes_attributes_before_save(self):
 		self.db.update.return_value = True
@@ -101,99 +106,96 @@ class TestProductService(unittest.TestCase):
 		)
 		self.assertEqual(result["attributes"], [{"name": "foo", "value": "bar"}])
 
-	def test_delete_product_raises_if_missing(self):
-		self.db.delete.return_value = False
-
-		with self.assertRaises(KeyError):
-			self.service.delete_product("404")
-
 
 class TestInventoryService(unittest.TestCase):
-	def setUp(self):
-		self.db = MagicMock()
-		self.service = InventoryService(self.db)
-
-	def test_add_product_rejects_non_positive_quantity(self):
-		with self.assertRaises(ValueError):
-			self.service.add_product("1", "2", 0)
+	@classmethod
+	def setUpClass(cls):
+		cls.db = MagicMock(spec_set=DatabasePort)
+		cls.service = InventoryService(cls.db)
 
-		with self.assertRaises(ValueError):
-			self.service.add_product("1", "2", -1)
-
-	def test_add_product_rejects_non_numeric_ids(self):
-		with self.assertRaises(ValueError):
-			self.service.add_product("A", "2", 1)
-
-		with self.assertRaises(ValueError):
-			self.service.add_product("1", "X", 1)
+	def setUp(self):
+		self.db.reset_mock(return_value=True, side_effect=True)
+
+	def test_quantity_changes_reject_invalid_input(self):
+		calls = (
+			(self.service.add_product, ("1", "2", 0)),
+			(self.service.add_product, ("1", "2", -1)),
+			(self.service.add_product, ("A", "2", 1)),
+			(self.service.add_product, ("1", "X", 1)),
+			(self.service.update_quantity, ("1", "2", -1)),
+			(self.service.set_quantity, ("1", "2", -1)),
+		)
 
-	def test_update_quantity_rejects_negative(self):
-		with self.assertRaises(ValueError):
-			self.service.update_quantity("1", "2", -1)
+		for method, args in calls:
+			with self.subTest(method=method.__name__, args=args), self.assertRaises(ValueError):
+				method(*args)
 
 	def test_update_quantity_raises_if_inventory_entry_missing(self):
-		self.db.find_all.return_value = []
+		self.db.find_where.return_value = []
 
 		with self.assertRaises(KeyError):
 			self.service.update_quantity("1", "2", 5)
 
+		self.assertEqual(self.db.update.call_count, 0)
+
 	def test_update_quantity_updates_existing_entry(self):
-		self.db.find_all.return_value = [{"id": "10", "lager_id": 1, "produkt_id": 2, "menge": 1}]
+		self.db.find_where.return_value = [{"id": "10", "lager_id": 1, "produkt_id": 2, "menge": 1}]
 
 		self.service.update_quantity("1", "2", 5)
 
+		self.db.find_where.assert_called_once_with("inventory", {"lager_id": 1, "produkt_id": 2})
 		self.db.update.assert_called_once_with("inventory", "10", {"menge": 5})
 
 	def test_remove_product_raises_if_missing(self):
-		self.db.find_all.return_value = []
+		self.db.find_where.return_value = []
 
 		with self.assertRaises(KeyError):
 			self.service.remove_product("1", "2")
 
+		self.assertEqual(self.db.delete.call_count, 0)
+
 	def test_list_inventory_filters_by_warehouse(self):
-		self.db.find_all.return_value = [
-			{"id": "1", "lager_id": 1, "produkt_id": 7, "menge": 3},
-			{"id": "2", "lager_id": 2, "produkt_id": 7, "menge": 4},
-		]
+		self.db.find_where.return_value = [{"id": "1", "lager_id": 1, "produkt_id": 7, "menge": 3}]
 
 		result = self.service.list_inventory("1")
 
+		self.db.find_where.assert_called_once_with("inventory", {"lager_id": 1})
 		self.assertEqual(result, [{"id": "1", "lager_id": 1, "produkt_id": 7, "menge": 3}])
 
 	def test_set_quantity_zero_ignores_missing_entry(self):
-		self.db.find_all.return_value = []
+		self.db.find_where.return_value = []
 
 		self.service.set_quantity("1", "2", 0)
 
-		self.db.delete.assert_not_called()
+		self.assertEqual(self.db.find_where.call_count, 1)
+		self.assertEqual(self.db.delete.call_count, 0)
 
 	def test_set_quantity_creates_entry_if_missing(self):
-		self.db.find_all.return_value = []
+		self.db.find_where.return_value = []
 
 		self.service.set_quantity("1", "2", 7)
 
 		self.db.insert.assert_called_once_with("inventory", {"lager_id": 1, "produkt_id": 2, "menge": 7})
 
 	def test_set_quantity_updates_existing_entry(self):
-		self.db.find_all.return_value = [{"id": "11", "lager_id": 1, "produkt_id": 2, "menge": 2}]
+		self.db.find_where.return_value = [{"id": "11", "lager_id": 1, "produkt_id": 2, "menge": 2}]
 
 		self.service.set_quantity("1", "2", 9)
 
 		self.db.update.assert_called_once_with("inventory", "11", {"menge": 9})
 
-	def test_set_quantity_rejects_negative(self):
-		with self.assertRaises(ValueError):
-			self.service.set_quantity("1", "2", -1)
-
-	def test_statistics_report_aggregates_counts_and_stock(self):
-		self.db.find_all.side_effect = [
-			[{"id": "p1"}, {"id": "p2"}],
-			[{"id": "w1"}],
-			[{"menge": 3}, {"menge": 7}],
-		]
+	def test_statistics_report_uses_database_aggregate(self):
+		self.db.aggregate_statistics.return_value = {
+			"total_products": 2,
+			"total_warehouses": 1,
+			"total_stock_units": 10,
+		}
 
 		result = self.service.statistics_report()
 
+		self.db.aggregate_statistics.assert_called_once_with()
+		self.assertEqual(self.db.find_all.call_count, 0)
+
 		self.assertEqual(
 			result,
 			{
@@ -205,10 +207,15 @@ class TestInventoryService(unittest.TestCase):
 
 
 class TestWarehouseService(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.db = MagicMock(spec_set=DatabasePort)
+		cls.inventory_service = MagicMock(spec_set=InventoryServicePort)
+		cls.service = WarehouseService(cls.db, cls.inventory_service)
+
 	def setUp(self):
-		self.db = MagicMock()
-		self.inventory_service = MagicMock()
-		self.service = WarehouseService(self.db, self.inventory_service)
+		self.db.reset_mock(return_value=True, side_effect=True)
+		self.inventory_service.reset_mock(return_value=True, side_effect=True)
 
 	def test_create_warehouse_returns_payload_with_id(self):
 		self.db.insert.return_value = "7"
@@ -216,7 +223,7 @@ class TestWarehouseService(unittest.TestCase):
 		result = self.service.create_warehouse("Main", "Street 1", 100, 3)
 
 		self.assertEqual(result["id"], "7")
-		self.db.insert.assert_called_once()
+		self.assertEqual(self.db.insert.call_count, 1)
 		collection, inserted = self.db.insert.call_args.args
 		self.assertEqual(collection, "warehouses")
 		self.assertEqual(inserted["lagername"], "Main")
@@ -224,17 +231,17 @@ class TestWarehouseService(unittest.TestCase):
 		self.assertEqual(inserted["max_plaetze"], 100)
 		self.assertEqual(inserted["firma_id"], 3)
 
-	def test_update_warehouse_raises_if_missing(self):
+	def test_update_and_delete_warehouse_raise_if_missing(self):
 		self.db.update.return_value = False
-
-		with self.assertRaises(KeyError):
-			self.service.update_warehouse("999", {"lagername": "Other"})
-
-	def test_delete_warehouse_raises_if_missing(self):
 		self.db.delete.return_value = False
+		calls = (
+			(self.service.update_warehouse, ("999", {"lagername": "Other"})),
+			(self.service.delete_warehouse, ("999",)),
+		)
 
-		with self.assertRaises(KeyError):
-			self.service.delete_warehouse("999")
+		for method, args in calls:
+			with self.subTest(method=method.__name__), self.assertRaises(KeyError):
+				method(*args)
 
 	def test_add_product_to_warehouse_delegates_with_string_ids(self):
 		self.service.add_product_to_warehouse(1, 2, 3)
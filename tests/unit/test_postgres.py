@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import MagicMock
+
+from bierapp.db.postgress import PostgresRepository
+
+
+class TestPostgresRepository(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.repo = PostgresRepository()
+		cls.repo.conn = MagicMock()
+		cls.cursor = cls.repo.conn.cursor.return_value.__enter__.return_value
+
+	def setUp(self):
+		self.repo.conn.reset_mock()
+		self.cursor.fetchall.return_value = [{"id": 1, "name": "Pils"}]
+
+	def test_find_many_by_ids_skips_non_numeric_ids(self):
+		rows = self.repo.find_many_by_ids("products", [1, "2", "abc", "", "3x"])
+
+		self.assertEqual(rows, [{"id": 1, "name": "Pils"}])
+		self.assertEqual(self.cursor.execute.call_count, 1)
+		self.assertEqual(self.cursor.execute.call_args.args[1], (["1", "2"],))
+
+	def test_find_many_by_ids_without_numeric_ids_skips_the_query(self):
+		self.assertEqual(self.repo.find_many_by_ids("products", ["abc", None]), [])
+		self.assertEqual(self.repo.conn.cursor.call_count, 0)
+
+
+if __name__ == "__main__":
+	unittest.main()